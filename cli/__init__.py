@@ -0,0 +1,5 @@
+"""Command-line interface for the Hash Audit Tool."""
+
+from .interface import HashAuditCLI
+
+__all__ = ['HashAuditCLI']
@@ -0,0 +1,417 @@
+"""Command-line interface for the Hash Audit Tool.
+
+Heavy ``core.*`` modules are imported lazily so that ``--help``,
+``--version`` and the ``info`` command do not pay for loading every hash
+and attack implementation on startup.
+"""
+
+import argparse
+import csv
+import functools
+import importlib
+import io
+import os
+import sys
+import time
+from typing import Any, Dict, Optional
+
+__version__ = '1.0.0'
+
+
+@functools.lru_cache(maxsize=None)
+def _load(module_name: str, class_name: str) -> Any:
+    """Import ``class_name`` from ``module_name`` on first use."""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_algorithm(module_name: str, class_name: str) -> Any:
+    """Construct (once) a hash algorithm instance.
+
+    Algorithm objects are stateless, so one shared instance per process
+    avoids rebuilding potentially expensive objects for every hash in a
+    hash-file run.
+    """
+    return _load(module_name, class_name)()
+
+
+class LegalDisclaimer:
+    """Mandatory authorization notice shown before any cracking run."""
+
+    DISCLAIMER_TEXT = """
+================================================================================
+                        HASH AUDIT TOOL - LEGAL NOTICE
+================================================================================
+
+ This tool is provided exclusively for AUTHORIZED security testing,
+ password auditing, forensics and compliance verification.
+
+ By continuing you confirm that:
+
+   * You have explicit, written authorization to test every hash you
+     submit to this tool.
+   * You will comply with all applicable laws and regulations.
+   * You accept full responsibility for your use of this software.
+
+ Unauthorized use against systems or data you do not own or have
+ permission to test is illegal and strictly prohibited.
+
+================================================================================
+"""
+
+    @staticmethod
+    def display_disclaimer() -> None:
+        print(LegalDisclaimer.DISCLAIMER_TEXT, file=sys.stderr)
+
+    @staticmethod
+    def confirm_authorization() -> bool:
+        """Interactively confirm authorization; returns True if accepted."""
+        try:
+            answer = input("Type 'yes' to confirm you are authorized: ")
+        except EOFError:
+            return False
+        return answer.strip().lower() == 'yes'
+
+
+# Output templates, compiled once at import instead of re-lowering an
+# f-string per result.
+_SUCCESS_TMPL = (
+    "┌──────────────────────────────────────────────┐\n"
+    "│ PASSWORD FOUND                               │\n"
+    "└──────────────────────────────────────────────┘\n"
+    "  Password : {password}\n"
+    "  Attempts : {attempts}\n"
+    "  Elapsed  : {elapsed_time:.2f}s\n"
+    "  Rate     : {hashes_per_second:.0f} H/s"
+)
+_FAIL_TMPL = (
+    "┌──────────────────────────────────────────────┐\n"
+    "│ PASSWORD NOT FOUND                           │\n"
+    "└──────────────────────────────────────────────┘\n"
+    "  Attempts : {attempts}\n"
+    "  Elapsed  : {elapsed_time:.2f}s\n"
+    "  Rate     : {hashes_per_second:.0f} H/s"
+)
+_CSV_FIELDS = ('hash', 'success', 'password', 'attempts',
+               'elapsed_time', 'hashes_per_second')
+_CSV_HEADER = ','.join(_CSV_FIELDS)
+
+
+def _csv_row_values(result: Dict[str, Any]) -> tuple:
+    return (result.get('hash', ''), result['success'],
+            result.get('password') or '', result['attempts'],
+            f"{result['elapsed_time']:.2f}",
+            f"{result['hashes_per_second']:.0f}")
+
+
+class OutputFormatter:
+    """Renders cracking results for the terminal and for output files."""
+
+    @staticmethod
+    def format_csv_header() -> str:
+        return _CSV_HEADER
+
+    @staticmethod
+    def make_csv_writer(fp: Any) -> Any:
+        """Return a csv.writer with the header already written.
+
+        The C-implemented writer handles quoting/escaping and avoids
+        per-row Python string interpolation.
+        """
+        writer = csv.writer(fp, lineterminator='\n')
+        writer.writerow(_CSV_FIELDS)
+        return writer
+
+    @staticmethod
+    def write_csv_rows(fp: Any, results: Any) -> None:
+        """Bulk-write results (an iterable of result dicts) as CSV."""
+        writer = OutputFormatter.make_csv_writer(fp)
+        writer.writerows(_csv_row_values(result) for result in results)
+
+    @staticmethod
+    def format_csv_row(result: Dict[str, Any]) -> str:
+        # Through csv.writer so passwords containing commas, quotes or
+        # newlines come out escaped — the same rows the --output file
+        # path produces.
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator='').writerow(_csv_row_values(result))
+        return buf.getvalue()
+
+    @staticmethod
+    def format_result(result: Dict[str, Any], output_format: str = 'text') -> str:
+        if output_format == 'json':
+            import json
+            return json.dumps(result)
+        if output_format == 'csv':
+            # Single-result display; file loops emit the header once via
+            # format_csv_header() and then only rows.
+            return f'{_CSV_HEADER}\n{OutputFormatter.format_csv_row(result)}'
+        template = _SUCCESS_TMPL if result['success'] else _FAIL_TMPL
+        return template.format_map(result)
+
+
+class ProgressTracker:
+    """Periodic progress display driven by the engine's callback."""
+
+    def __init__(self, interval: float = 1.0) -> None:
+        self.interval = interval
+        self._last_report = 0.0
+
+    def update(self, stats: Any) -> None:
+        # The engine already throttles this callback (once per batch
+        # in-process, ~2 Hz in parallel mode), so the interval check
+        # alone is cheap enough — a tick gate here would swallow hours
+        # of callbacks before the first line appeared.
+        now = time.monotonic()
+        if now - self._last_report < self.interval:
+            return
+        self._last_report = now
+        # ``stats`` is the engine's slotted ProgressStats instance.
+        attempts = stats.attempts
+        elapsed = stats.elapsed_time
+        rate = attempts / elapsed if elapsed > 0 else 0
+        sys.stderr.write(f"\r  {attempts:,} attempts | {rate:,.0f} H/s | {elapsed:.0f}s")
+        sys.stderr.flush()
+
+
+class HashAuditCLI:
+    """Top-level argument parsing and command dispatch."""
+
+    # Class references are resolved lazily: (module, class name).
+    _ALGORITHM_CLASSES = {
+        'md5': ('core.hashes', 'MD5Hash'),
+        'sha1': ('core.hashes', 'SHA1Hash'),
+        'sha256': ('core.hashes', 'SHA256Hash'),
+        'sha512': ('core.hashes', 'SHA512Hash'),
+        'ntlm': ('core.hashes', 'NTLMHash'),
+        'bcrypt': ('core.hashes', 'BcryptHash'),
+        'pbkdf2': ('core.hashes', 'PBKDF2Hash'),
+    }
+
+    _ATTACK_CLASSES = {
+        'dictionary': ('core.attacks', 'DictionaryAttack'),
+        'brute': ('core.attacks', 'BruteForceAttack'),
+        'hybrid': ('core.attacks', 'HybridAttack'),
+    }
+
+    def create_parser(self) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser(
+            prog='hashcracker',
+            description='Professional hash-cracking and password auditing framework')
+        parser.add_argument('--version', action='version',
+                            version=f'%(prog)s {__version__}')
+        subparsers = parser.add_subparsers(dest='command')
+
+        crack = subparsers.add_parser('crack', help='Crack one or more hashes')
+        self._add_crack_arguments(crack)
+
+        info = subparsers.add_parser('info', help='Show algorithm/attack information')
+        info.add_argument('--algorithm', choices=sorted(self._ALGORITHM_CLASSES))
+        info.add_argument('--attack-mode', choices=sorted(self._ATTACK_CLASSES))
+        info.add_argument('--masks', action='store_true',
+                          help='List supported mask placeholders')
+        return parser
+
+    def _add_crack_arguments(self, parser: argparse.ArgumentParser) -> None:
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument('--hash', help='Single target hash')
+        target.add_argument('--hash-file', help='File with one hash per line')
+        parser.add_argument('--type', required=True,
+                            choices=sorted(self._ALGORITHM_CLASSES),
+                            help='Hash algorithm')
+        parser.add_argument('--mode', required=True,
+                            choices=sorted(self._ATTACK_CLASSES),
+                            help='Attack mode')
+        parser.add_argument('--wordlist', help='Wordlist path (dictionary/hybrid)')
+        parser.add_argument('--mask', help='Mask pattern (brute/hybrid)')
+        parser.add_argument('--min-length', type=int)
+        parser.add_argument('--max-length', type=int)
+        parser.add_argument('--hybrid-mode', default='append',
+                            choices=('append', 'prepend', 'both',
+                                     'rules_brute'),
+                            help='Hybrid sub-mode')
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Worker process count (default: CPU count)')
+        parser.add_argument('--timeout', type=float, help='Per-hash timeout (s)')
+        parser.add_argument('--output', help='Write results to this file')
+        parser.add_argument('--format', default='text',
+                            choices=('text', 'json', 'csv'))
+        parser.add_argument('--authorized', action='store_true',
+                            help='Confirm authorization non-interactively')
+        parser.add_argument('--verbose', '-v', action='store_true')
+
+    def run(self, argv: Optional[list] = None) -> int:
+        parser = self.create_parser()
+        args = parser.parse_args(argv)
+
+        if args.command == 'crack':
+            # Scripted/CI runs (pre-authorized, no TTY) skip the banner;
+            # interactive runs always see it.
+            if not (args.authorized and not sys.stdin.isatty()):
+                LegalDisclaimer.display_disclaimer()
+            if not args.authorized and not LegalDisclaimer.confirm_authorization():
+                print('Authorization not confirmed; aborting.', file=sys.stderr)
+                return 2
+            return self._handle_crack_command(args)
+        if args.command == 'info':
+            return self._handle_info_command(args)
+        parser.print_help()
+        return 0
+
+    def _get_hash_algorithm(self, name: str) -> Any:
+        return _make_algorithm(*self._ALGORITHM_CLASSES[name])
+
+    def _get_attack_strategy(self, args: argparse.Namespace) -> Any:
+        if args.mode == 'dictionary':
+            if not args.wordlist:
+                raise ValueError('--wordlist is required for dictionary mode')
+            cls = _load(*self._ATTACK_CLASSES['dictionary'])
+            return cls(args.wordlist)
+        if args.mode == 'brute':
+            cls = _load(*self._ATTACK_CLASSES['brute'])
+            return cls(mask=args.mask, min_length=args.min_length,
+                       max_length=args.max_length)
+        if not args.wordlist:
+            raise ValueError('--wordlist is required for hybrid mode')
+        dictionary_cls = _load(*self._ATTACK_CLASSES['dictionary'])
+        brute_cls = _load(*self._ATTACK_CLASSES['brute'])
+        cls = _load(*self._ATTACK_CLASSES['hybrid'])
+        return cls(dictionary_cls(args.wordlist),
+                   brute_cls(mask=args.mask, min_length=args.min_length,
+                             max_length=args.max_length),
+                   mode=args.hybrid_mode)
+
+    def _handle_crack_command(self, args: argparse.Namespace) -> int:
+        try:
+            hash_algorithm = self._get_hash_algorithm(args.type)
+            attack_strategy = self._get_attack_strategy(args)
+            # Reject bad input before the run starts: a malformed target
+            # or missing wordlist is a usage error, not a traceback.
+            if args.wordlist and not os.path.isfile(args.wordlist):
+                raise ValueError(f'wordlist not found: {args.wordlist}')
+            if args.hash and not hash_algorithm.validate_hash(args.hash):
+                raise ValueError(
+                    f'{args.hash!r} is not a valid {args.type} hash')
+        except ValueError as exc:
+            print(f'Error: {exc}', file=sys.stderr)
+            return 2
+
+        engine_cls = _load('core.engine', 'CrackingEngine')
+        tracker = ProgressTracker() if args.verbose else None
+        engine = engine_cls(max_workers=args.workers,
+                            progress_callback=tracker.update if tracker else None)
+
+        try:
+            if args.hash_file:
+                return self._crack_hash_file(args, engine, hash_algorithm,
+                                             attack_strategy)
+            return self._crack_single_hash(args, engine, hash_algorithm,
+                                           attack_strategy)
+        except (ValueError, OSError, RuntimeError) as exc:
+            # Covers what pre-flight cannot: malformed lines in a hash
+            # file, a wordlist that vanishes mid-run, crashed workers.
+            print(f'Error: {exc}', file=sys.stderr)
+            return 2
+
+    def _crack_single_hash(self, args: argparse.Namespace, engine: Any,
+                           hash_algorithm: Any, attack_strategy: Any) -> int:
+        result = engine.crack_hash(args.hash, hash_algorithm, attack_strategy,
+                                   timeout=args.timeout)
+        payload = dict(result.to_dict(), hash=args.hash)
+        output = OutputFormatter.format_result(payload, args.format)
+        print(output)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+        return 0 if result.success else 1
+
+    def _iter_hashes(self, path: str) -> Any:
+        """Yield non-empty hash lines without materializing the file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+
+    def _crack_hash_file(self, args: argparse.Namespace, engine: Any,
+                         hash_algorithm: Any, attack_strategy: Any) -> int:
+        """Crack a hash file as a stream, appending results as they complete.
+
+        Neither the hash list nor the results are held in memory; output
+        (including the JSON array form) is written incrementally through a
+        large buffer so memory stays constant for arbitrarily large dumps.
+        """
+        out = None
+        if args.output:
+            out = open(args.output, 'w', encoding='utf-8', buffering=512 * 1024)
+            if args.format == 'json':
+                out.write('[\n')
+            elif args.format == 'csv':
+                csv_writer = OutputFormatter.make_csv_writer(out)
+
+        import json
+        cracked = 0
+        total = 0
+        stdout_write = sys.stdout.write
+        try:
+            for index, target in enumerate(self._iter_hashes(args.hash_file), 1):
+                total = index
+                strategy = self._get_attack_strategy(args)
+                result = engine.crack_hash(target, hash_algorithm, strategy,
+                                           timeout=args.timeout)
+                if result.success:
+                    cracked += 1
+                payload = dict(result.to_dict(), hash=target)
+                # One stdout write (and one I/O-lock round-trip) per hash
+                # instead of one per line.
+                buf = io.StringIO()
+                buf.write(f'[{index}] cracking {target}\n')
+                if args.format == 'csv':
+                    if index == 1:
+                        buf.write(OutputFormatter.format_csv_header() + '\n')
+                    buf.write(OutputFormatter.format_csv_row(payload) + '\n')
+                else:
+                    buf.write(OutputFormatter.format_result(payload, args.format) + '\n')
+                stdout_write(buf.getvalue())
+                if out is not None:
+                    if args.format == 'json':
+                        if index > 1:
+                            out.write(',\n')
+                        out.write(json.dumps(payload))
+                    elif args.format == 'csv':
+                        csv_writer.writerow(_csv_row_values(payload))
+                    else:
+                        out.write(OutputFormatter.format_result(payload, args.format) + '\n')
+        finally:
+            if out is not None:
+                if args.format == 'json':
+                    out.write('\n]\n')
+                out.close()
+
+        print(f'\nCracked {cracked}/{total} hashes.')
+        return 0 if cracked else 1
+
+    def _handle_info_command(self, args: argparse.Namespace) -> int:
+        if args.masks:
+            cls = _load('core.attacks', 'BruteForceAttack')
+            print('Supported mask placeholders:')
+            for placeholder, charset in cls.CHARACTER_SETS.items():
+                charset = charset.decode('ascii') if isinstance(charset, bytes) else charset
+                print(f'  {placeholder}  {charset}')
+            return 0
+        if args.algorithm:
+            algorithm = self._get_hash_algorithm(args.algorithm)
+            for key, value in algorithm.get_info().items():
+                print(f'  {key}: {value}')
+            return 0
+        if args.attack_mode:
+            module_name, class_name = self._ATTACK_CLASSES[args.attack_mode]
+            cls = _load(module_name, class_name)
+            print(f'  {class_name}: {cls.__doc__.strip().splitlines()[0]}')
+            return 0
+        print('Specify --algorithm, --attack-mode or --masks.', file=sys.stderr)
+        return 2
+
+
+def main(argv: Optional[list] = None) -> int:
+    return HashAuditCLI().run(argv)
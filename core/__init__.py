@@ -0,0 +1 @@
+"""Core package for the Hash Audit Tool."""
@@ -0,0 +1,9 @@
+"""Attack strategy implementations."""
+
+from .base import AttackStrategy
+from .brute_force import BruteForceAttack
+from .dictionary import DictionaryAttack
+from .hybrid import HybridAttack
+
+__all__ = ['AttackStrategy', 'BruteForceAttack', 'DictionaryAttack',
+           'HybridAttack']
@@ -0,0 +1,85 @@
+"""Optional Numba-accelerated kernels for brute-force candidate generation.
+
+When ``numba``/``numpy`` are installed the mixed-radix counter kernel below
+emits candidates in batches directly into a preallocated ``uint8`` buffer,
+eliminating the per-candidate tuple and ``str`` allocations of the pure-Python
+``itertools.product`` path.  The JIT is warmed once at import so first-call
+compilation cost is not paid on the hot path.
+"""
+
+try:
+    import numpy as np
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised when numba is absent
+    np = None
+    njit = None
+    prange = None
+    HAVE_NUMBA = False
+
+#: Candidates emitted per kernel call.
+BATCH_SIZE = 4096
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def fill_batch(idx, charsets, lengths, out, n_positions):
+        """Emit ``out.shape[0]`` candidates from the current counter state.
+
+        ``idx`` is the mixed-radix counter (one digit per mask position),
+        ``charsets`` a rectangular ``uint8`` matrix with one row per
+        position, ``lengths`` the radix of each position.  Each batch row
+        ``b`` receives ``charsets[p, idx[p]]`` for every position ``p``,
+        after which the counter is incremented with carry.  Returns the
+        number of candidates written.
+        """
+        batch = out.shape[0]
+        for b in range(batch):
+            for p in range(n_positions):
+                out[b, p] = charsets[p, idx[p]]
+            p = n_positions - 1
+            while p >= 0:
+                idx[p] += 1
+                if idx[p] < lengths[p]:
+                    break
+                idx[p] = 0
+                p -= 1
+        return batch
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def decode_range(start, count, charsets_flat, offsets, radixes,
+                     n_positions, out):
+        """Decode keyspace indices ``[start, start+count)`` into ``out``.
+
+        Each ``prange`` iteration decodes one index independently by
+        repeated div/mod — the archetypal no-branch, no-dependency loop,
+        so Numba parallelizes it across cores.  ``out`` is a flat
+        ``uint8`` buffer of ``count * n_positions`` bytes, rows back to
+        back.
+        """
+        for i in prange(count):
+            rem = start + i
+            base = i * n_positions
+            for p in range(n_positions - 1, -1, -1):
+                radix = radixes[p]
+                out[base + p] = charsets_flat[offsets[p] + rem % radix]
+                rem //= radix
+
+    def _warm() -> None:
+        """Trigger JIT compilation once at import time."""
+        idx = np.zeros(1, dtype=np.uint8)
+        charsets = np.full((1, 1), ord('a'), dtype=np.uint8)
+        lengths = np.ones(1, dtype=np.int32)
+        out = np.empty((2, 1), dtype=np.uint8)
+        fill_batch(idx, charsets, lengths, out, 1)
+        flat = np.full(1, ord('a'), dtype=np.uint8)
+        offsets = np.zeros(1, dtype=np.int64)
+        radixes = np.ones(1, dtype=np.int64)
+        decode_range(0, 1, flat, offsets, radixes, 1,
+                     np.empty(1, dtype=np.uint8))
+
+    _warm()
+
+else:
+    fill_batch = None
+    decode_range = None
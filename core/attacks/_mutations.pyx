@@ -0,0 +1,57 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Cython mutation kernel: all variants of a word in one Python call.
+
+Build in place with::
+
+    cythonize -i core/attacks/_mutations.pyx
+
+(compile with ``-O3 -march=native`` via ``CFLAGS`` to let the compiler
+vectorize the per-byte leet translate).  When the compiled module is
+absent, ``DictionaryAttack`` falls back to the pure-Python
+``_apply_mutations`` generator.
+
+``mutate_all`` returns a list, so the generator boundary is crossed
+once per base word instead of once per mutation, and the per-byte
+transforms run as C loops instead of interpreter bytecode.  The
+emission rules mirror ``_apply_mutations``: each distinct variant is
+produced exactly once by construction.
+"""
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+
+
+cdef bytes _leet(const unsigned char* buf, Py_ssize_t n,
+                 const unsigned char* table):
+    """Translate ``buf`` through a 256-entry table into fresh bytes."""
+    out = PyBytes_FromStringAndSize(<const char*> buf, n)
+    cdef unsigned char* dst = <unsigned char*> PyBytes_AS_STRING(out)
+    cdef Py_ssize_t i
+    for i in range(n):
+        dst[i] = table[dst[i]]
+    return out
+
+
+def mutate_all(bytes word, tuple suffixes, tuple prefixes, bytes table):
+    """Return every distinct mutation of ``word`` as a list."""
+    cdef list out = []
+    cdef bytes lower = word.lower()
+    cdef bytes upper, capitalized, leet, prefixed
+    if lower != word:
+        out.append(lower)
+    upper = word.upper()
+    if upper != word and upper != lower:
+        out.append(upper)
+    capitalized = word.capitalize()
+    if capitalized != word and capitalized != lower and capitalized != upper:
+        out.append(capitalized)
+    leet = _leet(<const unsigned char*> PyBytes_AS_STRING(word), len(word),
+                 <const unsigned char*> PyBytes_AS_STRING(table))
+    if leet != word:
+        out.append(leet)
+    for suffix in suffixes:
+        out.append(word + suffix)
+    for prefix in prefixes:
+        prefixed = prefix + word
+        if prefixed != word + prefix:
+            out.append(prefixed)
+    return out
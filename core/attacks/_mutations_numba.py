@@ -0,0 +1,103 @@
+"""Optional Numba-accelerated kernels for dictionary word mutations.
+
+When ``numba``/``numpy`` are installed, batches of words are packed into
+one contiguous ``uint8`` buffer with an ``int32`` offsets array and each
+mutation family (leetspeak translate, suffix/prefix concat) runs as a
+single JIT kernel over the whole batch — parallel across cores — instead
+of per-word CPython bytecode.  The pure-Python path in
+``DictionaryAttack._apply_mutations`` remains the fallback.
+"""
+
+try:
+    import numpy as np
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised when numba is absent
+    np = None
+    njit = None
+    prange = None
+    HAVE_NUMBA = False
+
+#: Words accumulated before each kernel dispatch.
+CHUNK_SIZE = 8192
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def leet_translate(in_buf, in_off, out_buf):
+        """Translate every word in the packed batch through a 256-entry table.
+
+        ``in_off`` has ``n_words + 1`` entries delimiting each word in
+        ``in_buf``; ``out_buf`` must be at least ``in_buf`` sized and the
+        first 256 bytes of it are pre-filled with the translation table
+        by the caller before the batch payload region.
+        """
+        n_words = in_off.shape[0] - 1
+        for w in prange(n_words):
+            for i in range(in_off[w], in_off[w + 1]):
+                out_buf[256 + i] = out_buf[in_buf[i]]
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def append_suffix(in_buf, in_off, suffix, out_buf, out_off):
+        """Write ``word + suffix`` for every packed word.
+
+        ``out_off`` must be pre-computed as the cumulative lengths of the
+        mutated words (``len(word) + len(suffix)`` each).
+        """
+        n_words = in_off.shape[0] - 1
+        n_suffix = suffix.shape[0]
+        for w in prange(n_words):
+            dst = out_off[w]
+            for i in range(in_off[w], in_off[w + 1]):
+                out_buf[dst] = in_buf[i]
+                dst += 1
+            for i in range(n_suffix):
+                out_buf[dst + i] = suffix[i]
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def prepend_prefix(in_buf, in_off, prefix, out_buf, out_off):
+        """Write ``prefix + word`` for every packed word."""
+        n_words = in_off.shape[0] - 1
+        n_prefix = prefix.shape[0]
+        for w in prange(n_words):
+            dst = out_off[w]
+            for i in range(n_prefix):
+                out_buf[dst + i] = prefix[i]
+            dst += n_prefix
+            for i in range(in_off[w], in_off[w + 1]):
+                out_buf[dst] = in_buf[i]
+                dst += 1
+
+    def pack_words(words):
+        """Pack a list of ``bytes`` into a (buffer, offsets) pair."""
+        offsets = np.zeros(len(words) + 1, dtype=np.int32)
+        for i, word in enumerate(words):
+            offsets[i + 1] = offsets[i] + len(word)
+        buf = np.frombuffer(b''.join(words), dtype=np.uint8)
+        return buf, offsets
+
+    def affix_offsets(in_off, extra):
+        """Offsets for mutated words each ``extra`` bytes longer."""
+        n_words = in_off.shape[0] - 1
+        return in_off[:-1] + np.arange(n_words, dtype=np.int32) * extra
+
+    def _warm() -> None:
+        """Trigger JIT compilation once at import time."""
+        buf, off = pack_words([b'ab'])
+        out = np.zeros(256 + buf.shape[0], dtype=np.uint8)
+        out[:256] = np.arange(256, dtype=np.uint8)
+        leet_translate(buf, off, out)
+        affix = np.frombuffer(b'1', dtype=np.uint8)
+        out2 = np.empty(buf.shape[0] + affix.shape[0], dtype=np.uint8)
+        out2_off = affix_offsets(off, affix.shape[0])
+        append_suffix(buf, off, affix, out2, out2_off)
+        prepend_prefix(buf, off, affix, out2, out2_off)
+
+    _warm()
+
+else:
+    leet_translate = None
+    append_suffix = None
+    prepend_prefix = None
+    pack_words = None
+    affix_offsets = None
@@ -0,0 +1,157 @@
+"""Base classes shared by all attack strategies."""
+
+import itertools
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class AttackStrategy(ABC):
+    """Abstract base class for cracking attack strategies.
+
+    Concrete strategies produce candidate passwords via
+    :meth:`generate_candidates`; the engine verifies each candidate
+    against the target hash.
+    """
+
+    def __init__(self) -> None:
+        self.attempts: int = 0
+        self.target_hash: Optional[str] = None
+        self.hash_algorithm: Any = None
+        self._prepared_target: Any = None
+
+    def set_target(self, target_hash: str, hash_algorithm: Any = None) -> None:
+        """Bind the target hash (normalized and prepared once) and its algorithm."""
+        self.hash_algorithm = hash_algorithm
+        if hash_algorithm is not None and hasattr(hash_algorithm, 'normalize_hash'):
+            self.target_hash = hash_algorithm.normalize_hash(target_hash)
+            self._prepared_target = hash_algorithm.prepare_target(target_hash)
+        else:
+            self.target_hash = target_hash.strip().lower()
+            self._prepared_target = None
+
+    def verify_candidate(self, candidate: Any) -> bool:
+        """Check one candidate against the target hash.
+
+        Uses the target prepared in :meth:`set_target`, so no hex decode
+        or re-normalization happens per candidate.
+        """
+        self.attempts += 1
+        if self._prepared_target is not None:
+            return self.hash_algorithm.verify_prepared(candidate, self._prepared_target)
+        return self.hash_algorithm.verify(candidate, self.target_hash)
+
+    def add_attempts(self, n: int) -> None:
+        """Flush a batch of attempts counted locally by the engine.
+
+        The engine keeps a local counter in its hot loop and flushes it
+        here in coarse batches, avoiding an attribute store per candidate.
+        """
+        self.attempts += n
+
+    def to_config(self) -> Dict[str, Any]:
+        """Constructor arguments needed to rebuild this strategy.
+
+        Workers receive this dict instead of a pickled instance, so the
+        per-worker payload is O(1) regardless of keyspace size.
+        Strategies that cannot be rebuilt from plain data may leave this
+        unimplemented; the engine then falls back to single-process mode.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'AttackStrategy':
+        """Rebuild a strategy from :meth:`to_config` output."""
+        return cls(**config)
+
+    def iter_shard(self, shard_id: int, num_shards: int) -> Iterator[Any]:
+        """Yield this shard's slice of the candidate stream.
+
+        Default partition is by candidate index modulo ``num_shards``
+        via ``itertools.islice`` (the stepping happens in C, so skipped
+        candidates cost no Python bytecode).  Strategies whose keyspace
+        can be split without enumerating it should override this.
+        """
+        return itertools.islice(self.generate_candidates(),
+                                shard_id, None, num_shards)
+
+    #: Target payload per adaptive batch; roughly one pipe-buffer's worth.
+    _BATCH_TARGET_BYTES = 1_000_000
+    #: Candidates sampled to estimate the mean candidate length.
+    _BATCH_PROBE_SIZE = 1024
+
+    def generate_batches(self,
+                         batch_size: Optional[int] = None) -> Iterator[List[bytes]]:
+        """Yield candidates grouped into batches of ``bytes``.
+
+        Batching lets the engine verify candidates in bulk against a raw
+        target digest instead of allocating one ``str`` plus one ``bytes``
+        per attempt.  When ``batch_size`` is omitted it is sized from the
+        mean length of the first :data:`_BATCH_PROBE_SIZE` candidates so
+        the per-batch payload stays near :data:`_BATCH_TARGET_BYTES`
+        whether candidates are 8-byte words or 32-byte hybrid strings
+        (the probe itself goes out as the first, undersized batch).
+        Strategies with a native batch representation should override
+        this.
+        """
+        gen = self.generate_candidates()
+        if batch_size is None:
+            probe: List[bytes] = []
+            for candidate in itertools.islice(gen, self._BATCH_PROBE_SIZE):
+                if isinstance(candidate, str):
+                    candidate = candidate.encode('utf-8')
+                probe.append(candidate)
+            if not probe:
+                return
+            # 24 bytes ≈ the PyBytes object header on 64-bit builds.
+            mean_len = sum(map(len, probe)) // len(probe)
+            batch_size = max(1024, min(65536,
+                                       self._BATCH_TARGET_BYTES // (mean_len + 24)))
+            yield probe
+        batch: List[bytes] = []
+        append = batch.append
+        for candidate in gen:
+            if isinstance(candidate, str):
+                candidate = candidate.encode('utf-8')
+            append(candidate)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+                append = batch.append
+        if batch:
+            yield batch
+
+    def generate_length_batches(self,
+                                batch_size: int = 4096
+                                ) -> Iterator[Tuple[int, List[bytes]]]:
+        """Yield ``(length, batch)`` groups of same-length candidates.
+
+        Multi-buffer hash primitives (SHA-NI 4-way lanes, isa-l_crypto
+        ctx managers) require all lanes to share a length; this groups
+        the stream into per-length buckets and flushes each bucket when
+        it fills, so such a backend can consume uniform batches without
+        re-sorting.  Buckets still holding candidates at exhaustion are
+        flushed undersized.
+        """
+        buckets: Dict[int, List[bytes]] = {}
+        for candidate in self.generate_candidates():
+            if isinstance(candidate, str):
+                candidate = candidate.encode('utf-8')
+            length = len(candidate)
+            bucket = buckets.setdefault(length, [])
+            bucket.append(candidate)
+            if len(bucket) == batch_size:
+                yield length, bucket
+                buckets[length] = []
+        for length, bucket in buckets.items():
+            if bucket:
+                yield length, bucket
+
+    @abstractmethod
+    def generate_candidates(self) -> Iterator[Any]:
+        """Yield candidate passwords for this strategy."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_info(self) -> Dict[str, Any]:
+        """Return a description of this strategy's configuration."""
+        raise NotImplementedError
@@ -0,0 +1,374 @@
+"""Mask- and charset-based brute-force attack strategy."""
+
+import functools
+import hashlib
+import itertools
+import marshal
+import math
+import os
+import tempfile
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from . import _brute_kernels
+from .base import AttackStrategy
+
+
+def _specialized_generator(n_positions: int) -> Any:
+    """Build (and cache per position count) a mask-specialized generator.
+
+    The generated source unrolls one ``for`` loop per mask position with
+    the character sets bound as arguments, e.g. for three positions::
+
+        def _gen(cs0, cs1, cs2, _bytes=bytes):
+            for c0 in cs0:
+                for c1 in cs1:
+                    for c2 in cs2:
+                        yield _bytes((c0, c1, c2))
+
+    This removes the generic ``itertools.product`` wrapper and all
+    per-iteration dispatch from the hot loop; iterating ``bytes`` yields
+    ints, so assembling a candidate is a single ``bytes(tuple)`` call.
+    """
+    fn = _CODEGEN_CACHE.get(n_positions)
+    if fn is None:
+        args = ', '.join(f'cs{p}' for p in range(n_positions))
+        lines = [f'def _gen({args}, _bytes=bytes):']
+        indent = '    '
+        for p in range(n_positions):
+            lines.append(f'{indent}for c{p} in cs{p}:')
+            indent += '    '
+        cells = ', '.join(f'c{p}' for p in range(n_positions))
+        lines.append(f'{indent}yield _bytes(({cells},))')
+        namespace: Dict[str, Any] = {}
+        exec(compile('\n'.join(lines), '<mask-codegen>', 'exec'), namespace)
+        fn = _CODEGEN_CACHE[n_positions] = namespace['_gen']
+    return fn
+
+
+_CODEGEN_CACHE: Dict[int, Any] = {}
+
+
+_MASK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache',
+                               'hashcracker', 'masks')
+
+
+def _mask_cache_path(mask: str) -> str:
+    key = hashlib.blake2b(mask.encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(_MASK_CACHE_DIR, f'{key}.marshal')
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_mask(mask: str) -> Tuple[Tuple[bytes, ...], int]:
+    """Parse a mask, consulting the on-disk cache across invocations.
+
+    Returns ``(charsets, length)``.  The in-memory lru_cache covers
+    repeats within a process; the marshal sidecar under
+    ``~/.cache/hashcracker/masks/`` amortizes the parse across the
+    repeated-CLI-invocation pattern.  Cache failures of any kind fall
+    back to parsing.
+    """
+    path = _mask_cache_path(mask)
+    try:
+        with open(path, 'rb') as f:
+            charsets, length = marshal.load(f)
+        return tuple(charsets), length
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+    parsed = _parse_mask_uncached(mask)
+    try:
+        os.makedirs(_MASK_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_MASK_CACHE_DIR)
+        with os.fdopen(fd, 'wb') as f:
+            marshal.dump((list(parsed[0]), parsed[1]), f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return parsed
+
+
+def _parse_mask_uncached(mask: str) -> Tuple[Tuple[bytes, ...], int]:
+    """Parse a mask into per-position character sets in a single pass."""
+    charsets: List[bytes] = []
+    i = 0
+    while i < len(mask):
+        if mask[i] == '?' and i + 1 < len(mask):
+            placeholder = mask[i:i + 2]
+            if placeholder in BruteForceAttack.CHARACTER_SETS:
+                charsets.append(BruteForceAttack.CHARACTER_SETS[placeholder])
+                i += 2
+                continue
+            raise ValueError(f"Unknown mask placeholder: {placeholder}")
+        charsets.append(mask[i].encode('latin-1'))
+        i += 1
+    return tuple(charsets), len(charsets)
+
+
+class BruteForceAttack(AttackStrategy):
+    """Systematic brute-force attack over a mask or a flat character set.
+
+    A mask such as ``?l?l?l?d?d`` expands to one character set per
+    position; alternatively a single character set plus a length range
+    enumerates all combinations of each length.
+    """
+
+    # Stored as bytes: candidates feed hashlib directly, so keeping the
+    # sets in bytes form avoids a str->bytes encode per candidate.
+    CHARACTER_SETS = {
+        '?l': b'abcdefghijklmnopqrstuvwxyz',
+        '?u': b'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+        '?d': b'0123456789',
+        '?s': b'!@#$%^&*()-_=+[]{}|;:\'",.<>/?`~',
+        '?a': (b'abcdefghijklmnopqrstuvwxyz'
+               b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+               b'0123456789'
+               b'!@#$%^&*()-_=+[]{}|;:\'",.<>/?`~'),
+        '?b': b'01',
+        '?h': b'0123456789abcdef',
+        '?H': b'0123456789ABCDEF',
+    }
+
+    def __init__(self,
+                 mask: Optional[str] = None,
+                 character_set: Optional[str] = None,
+                 min_length: Optional[int] = None,
+                 max_length: Optional[int] = None) -> None:
+        super().__init__()
+        self.name = 'brute_force'
+        self.mask = mask
+        if mask:
+            charsets, length = _parse_mask(mask)
+            self.character_set: Union[bytes, List[bytes]] = list(charsets)
+            self.min_length = min_length if min_length is not None else length
+            self.max_length = max_length if max_length is not None else length
+        else:
+            charset = character_set or self.CHARACTER_SETS['?l']
+            if isinstance(charset, str):
+                charset = charset.encode('latin-1')
+            self.character_set = charset
+            self.min_length = min_length if min_length is not None else 1
+            self.max_length = max_length if max_length is not None else 8
+        self._single_length = self.min_length == self.max_length
+        self.total_combinations = self._calculate_total_combinations()
+
+    def _expand_mask(self, mask: str) -> List[bytes]:
+        """Expand a mask string into one character set per position."""
+        return list(_parse_mask(mask)[0])
+
+    def _extract_length_from_mask(self, mask: str) -> int:
+        """Count the number of positions a mask describes."""
+        return _parse_mask(mask)[1]
+
+    def _calculate_total_combinations(self) -> int:
+        """Total size of the keyspace this attack will enumerate."""
+        if isinstance(self.character_set, list):
+            return math.prod(map(len, self.character_set))
+        size = len(self.character_set)
+        return sum(size ** length
+                   for length in range(self.min_length, self.max_length + 1))
+
+    def generate_candidates(self) -> Iterator[Any]:
+        """Yield every candidate in the configured keyspace.
+
+        All paths yield ``bytes``.  When Numba is available, mask-based
+        keyspaces are enumerated by a JIT-compiled mixed-radix counter
+        that writes batches of candidates into a reused ``uint8`` buffer;
+        otherwise the packed-counter or ``itertools.product`` paths apply.
+        """
+        if isinstance(self.character_set, list):
+            if _brute_kernels.HAVE_NUMBA:
+                yield from self._generate_batched(self.character_set)
+            else:
+                gen = _specialized_generator(len(self.character_set))
+                yield from gen(*self.character_set)
+        elif self._single_length:
+            # Common brute-from-mask case: skip the length-range loop layer.
+            for combo in itertools.product(self.character_set,
+                                           repeat=self.min_length):
+                yield bytes(combo)
+        else:
+            for length in range(self.min_length, self.max_length + 1):
+                for combo in itertools.product(self.character_set, repeat=length):
+                    yield bytes(combo)
+
+    def _generate_batched(self, charsets: List[bytes]) -> Iterator[bytes]:
+        """Numba path: batch-decode candidates from a mixed-radix counter."""
+        np = _brute_kernels.np
+        n_positions = len(charsets)
+        widest = max(len(cs) for cs in charsets)
+        matrix = np.zeros((n_positions, widest), dtype=np.uint8)
+        for p, cs in enumerate(charsets):
+            matrix[p, :len(cs)] = np.frombuffer(cs, dtype=np.uint8)
+        lengths = np.array([len(cs) for cs in charsets], dtype=np.int32)
+        idx = np.zeros(n_positions, dtype=np.uint8)
+        out = np.empty((_brute_kernels.BATCH_SIZE, n_positions), dtype=np.uint8)
+
+        remaining = self.total_combinations
+        while remaining > 0:
+            _brute_kernels.fill_batch(idx, matrix, lengths, out, n_positions)
+            take = min(out.shape[0], remaining)
+            for b in range(take):
+                yield out[b].tobytes()
+            remaining -= take
+
+    def to_config(self) -> Dict[str, Any]:
+        """Constructor arguments needed to rebuild this strategy."""
+        return {
+            'mask': self.mask,
+            'character_set': None if self.mask else self.character_set,
+            'min_length': self.min_length,
+            'max_length': self.max_length,
+        }
+
+    def iter_candidates(self) -> Iterator[bytes]:
+        """Return a fresh candidate stream.
+
+        Restarting is cheap — nothing is materialized — so callers such
+        as :class:`HybridAttack` may re-run the keyspace once per outer
+        word without memory cost.
+        """
+        return self.generate_candidates()
+
+    def iter_shard(self, shard_id: int, num_shards: int) -> Iterator[bytes]:
+        """Yield this shard's slice of the keyspace.
+
+        The keyspace is partitioned into equal contiguous integer ranges
+        ``[i*N//k, (i+1)*N//k)`` over the total combination count, each
+        decoded independently by a mixed-radix counter — perfectly
+        balanced for any shard count (unlike splitting on the leading
+        position's character set) and O(mask length) state per worker.
+        """
+        total = self.total_combinations
+        start = shard_id * total // num_shards
+        end = (shard_id + 1) * total // num_shards
+        return self.iter_range(start, end)
+
+    def iter_range(self, start: int, end: int) -> Iterator[bytes]:
+        """Yield candidates for keyspace indices ``[start, end)``."""
+        if isinstance(self.character_set, list):
+            yield from self._iter_mask_range(self.character_set, start, end)
+            return
+        charset = self.character_set
+        size = len(charset)
+        offset = 0
+        for length in range(self.min_length, self.max_length + 1):
+            count = size ** length
+            lo = max(start - offset, 0)
+            hi = min(end - offset, count)
+            if lo < hi:
+                yield from self._iter_mask_range([charset] * length, lo, hi)
+            offset += count
+            if offset >= end:
+                break
+
+    @staticmethod
+    def _iter_mask_range(charsets: List[bytes], start: int,
+                         end: int) -> Iterator[bytes]:
+        """Decode indices ``[start, end)`` of a mask keyspace.
+
+        ``start`` is decomposed into mixed-radix digits once; after that
+        each step is an increment-with-carry on the digit vector and an
+        in-place byte write, so seeking costs O(positions) regardless of
+        how deep into the keyspace the range begins.
+        """
+        n_positions = len(charsets)
+        radixes = [len(cs) for cs in charsets]
+        digits = [0] * n_positions
+        index = start
+        for p in range(n_positions - 1, -1, -1):
+            digits[p] = index % radixes[p]
+            index //= radixes[p]
+        word = bytearray(charsets[p][digits[p]] for p in range(n_positions))
+        _bytes = bytes
+        for _ in range(end - start):
+            yield _bytes(word)
+            p = n_positions - 1
+            while p >= 0:
+                digits[p] += 1
+                if digits[p] < radixes[p]:
+                    word[p] = charsets[p][digits[p]]
+                    break
+                digits[p] = 0
+                word[p] = charsets[p][0]
+                p -= 1
+
+    #: Candidates per block yielded by :meth:`iter_shard_blocks`.
+    BLOCK_SIZE = 65536
+
+    def iter_shard_blocks(self, shard_id: int, num_shards: int,
+                          block_size: int = BLOCK_SIZE
+                          ) -> Iterator[Tuple[int, bytes]]:
+        """Yield this shard's keyspace as ``(row_len, buffer)`` blocks.
+
+        Each buffer packs up to ``block_size`` same-length candidates
+        back to back — no per-candidate ``bytes`` object exists until a
+        verifier slices one out, and a whole block is handed to
+        ``verify_block`` in one call.  Flat-charset keyspaces spanning
+        several lengths emit one run of blocks per length, so every
+        buffer still has a fixed row length.
+        """
+        total = self.total_combinations
+        start = shard_id * total // num_shards
+        end = (shard_id + 1) * total // num_shards
+        if isinstance(self.character_set, list):
+            yield from self._blocks_from_range(self.character_set, start, end,
+                                               block_size)
+            return
+        charset = self.character_set
+        size = len(charset)
+        offset = 0
+        for length in range(self.min_length, self.max_length + 1):
+            count = size ** length
+            lo = max(start - offset, 0)
+            hi = min(end - offset, count)
+            if lo < hi:
+                yield from self._blocks_from_range([charset] * length, lo, hi,
+                                                   block_size)
+            offset += count
+            if offset >= end:
+                break
+
+    @staticmethod
+    def _blocks_from_range(charsets: List[bytes], start: int, end: int,
+                           block_size: int) -> Iterator[Tuple[int, bytes]]:
+        """Pack a mask index range into fixed-row contiguous buffers."""
+        row_len = len(charsets)
+        buf = bytearray()
+        rows = 0
+        for candidate in BruteForceAttack._iter_mask_range(charsets, start, end):
+            buf += candidate
+            rows += 1
+            if rows == block_size:
+                yield row_len, bytes(buf)
+                buf.clear()
+                rows = 0
+        if buf:
+            yield row_len, bytes(buf)
+
+    def _estimate_time(self, hashes_per_second: int = 1_000_000) -> Union[int, float]:
+        """Rough time estimate (seconds) at the given hash rate.
+
+        Keyspaces like ``?a``x12 exceed 2**53, where converting the bigint
+        to float silently loses precision — those stay in integer space
+        via floor division.
+        """
+        total = self.total_combinations
+        if total.bit_length() > 53:
+            return total // hashes_per_second
+        return total / hashes_per_second
+
+    def get_info(self) -> Dict[str, Any]:
+        """Return a description of this attack's configuration."""
+        estimate = self._estimate_time()
+        if isinstance(estimate, int) and estimate > 3600 * 10 ** 20:
+            display = '> 10^20 hours'
+        else:
+            display = f'{estimate / 3600:.1f} hours'
+        return {
+            'name': self.name,
+            'mask': self.mask,
+            'min_length': self.min_length,
+            'max_length': self.max_length,
+            'total_combinations': self.total_combinations,
+            'estimated_time_seconds': estimate,
+            'estimated_time_display': display,
+        }
@@ -0,0 +1,363 @@
+"""Wordlist-based dictionary attack strategy."""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..io import block_reader
+from ..utils import BloomFilter
+from . import _mutations_numba as _kernels
+from .base import AttackStrategy
+
+# Compiled Cython mutation kernel (see _mutations.pyx); optional, the
+# pure-Python _apply_mutations below is the fallback.
+try:
+    from . import _mutations as _cmutations
+except ImportError:
+    _cmutations = None
+
+
+class DictionaryAttack(AttackStrategy):
+    """Dictionary attack streaming candidates from a wordlist.
+
+    The wordlist is read in binary and every candidate is ``bytes`` end
+    to end — no UTF-8 decode on read and no re-encode before hashing.
+    Optional mutation rules derive common variants (case, leetspeak,
+    affixes) from each base word.
+
+    Base-word dedup uses a Bloom filter sized from the wordlist's file
+    size rather than an exact ``set``, keeping memory constant
+    regardless of wordlist length. The filter's false-positive rate
+    (1e-4) means a rare genuinely-new word may be skipped as a
+    duplicate — an acceptable trade against set memory that scales with
+    the keyspace.  Mutations are not filter-checked at all: the rules
+    are partitioned into equivalence classes that emit each distinct
+    variant exactly once by construction, so the hot path pays one
+    filter probe per base word rather than one per candidate.
+    """
+
+    #: Leetspeak substitutions applied in one translate pass.
+    _LEET_TABLE = bytes.maketrans(b'aeiostAEIOST', b'431057431057')
+
+    COMMON_SUFFIXES = (b'1', b'12', b'123', b'1234', b'!', b'!!', b'?',
+                       b'2023', b'2024', b'2025', b'01', b'69', b'007', b'99')
+    COMMON_PREFIXES = (b'1', b'123', b'!')
+
+    def __init__(self, wordlist_path: str, apply_rules: bool = True,
+                 lengths: Optional[Any] = None) -> None:
+        super().__init__()
+        self.name = 'dictionary'
+        self.wordlist_path = wordlist_path
+        self.apply_rules = apply_rules
+        # Optional candidate-length whitelist: real password lengths are
+        # heavily skewed, so skipping off-length candidates avoids their
+        # hashing cost entirely.
+        self.lengths = frozenset(lengths) if lengths is not None else None
+        self._wordlist_stats: Optional[Dict[str, Any]] = None
+        # Affixes with their lengths precomputed, plus one reusable
+        # scratch buffer laid out [prefix pad | word | suffix tail]: the
+        # word is copied in once per call and all 17 affixed variants
+        # are assembled in place, instead of one concat allocation each.
+        self._suffix_items = tuple((s, len(s)) for s in self.COMMON_SUFFIXES)
+        self._prefix_items = tuple((p, len(p)) for p in self.COMMON_PREFIXES)
+        self._prefix_pad = max(len(p) for p in self.COMMON_PREFIXES)
+        self._max_suffix = max(len(s) for s in self.COMMON_SUFFIXES)
+        self._scratch = bytearray(256)
+
+    def to_config(self) -> Dict[str, Any]:
+        """Constructor arguments needed to rebuild this strategy."""
+        return {
+            'wordlist_path': self.wordlist_path,
+            'apply_rules': self.apply_rules,
+            'lengths': sorted(self.lengths) if self.lengths is not None else None,
+        }
+
+    def _estimate_word_count(self) -> int:
+        """Estimate base-word count from file size, for filter sizing.
+
+        Only base words enter the Bloom filters — mutations are
+        deduplicated by construction and never inserted — so sizing by
+        the mutation fan-out would just multiply the bit array ~22x for
+        nothing.  Typical wordlists average ~8 bytes per line including
+        the newline.
+        """
+        try:
+            size = os.path.getsize(self.wordlist_path)
+        except OSError:
+            size = 0
+        return max(1024, size // 8)
+
+    def _iter_lines(self) -> Iterator[bytes]:
+        """Raw line stream, picking the reader by file size.
+
+        Wordlists past the block-reader threshold are read in 16 MB
+        unbuffered blocks split once per block; smaller files use plain
+        buffered line iteration.
+        """
+        if block_reader.use_block_reader(self.wordlist_path):
+            yield from block_reader.iter_lines(self.wordlist_path)
+            return
+        with block_reader.sequential_file(self.wordlist_path) as f:
+            yield from f
+
+    def _iter_words(self, seen: BloomFilter) -> Iterator[bytes]:
+        """Stream deduped base words, collecting stats along the way.
+
+        Statistics accumulate for free during the read that generation
+        needs anyway; they are only recorded (memory plus sidecar) when
+        the file is read to the end, so an early stop on a hit never
+        stores a partial scan.
+        """
+        total_words = 0
+        unique_count = 0
+        unique = BloomFilter(self._estimate_word_count())
+        min_length: Optional[int] = None
+        max_length = 0
+        for line in self._iter_lines():
+            word = line.rstrip(b'\r\n').strip()
+            if not word:
+                continue
+            total_words += 1
+            lowered = word.lower()
+            if lowered not in unique:
+                unique.add(lowered)
+                unique_count += 1
+            length = len(word)
+            if min_length is None or length < min_length:
+                min_length = length
+            if length > max_length:
+                max_length = length
+            if word in seen:
+                continue
+            seen.add(word)
+            yield word
+        self._store_stats({
+            'total_words': total_words,
+            'unique_words': unique_count,
+            'min_length': min_length or 0,
+            'max_length': max_length,
+        })
+
+    def generate_candidates(self,
+                            apply_rules: Optional[bool] = None) -> Iterator[bytes]:
+        """Stream unique candidates, length-filtered when configured.
+
+        ``apply_rules`` overrides the instance setting for this call
+        only, so callers like :class:`HybridAttack` can toggle mutations
+        without constructing (and re-scanning) a second attack.
+        """
+        rules = self.apply_rules if apply_rules is None else apply_rules
+        if self.lengths is None:
+            yield from self._generate_unfiltered(rules)
+            return
+        lengths = self.lengths
+        for candidate in self._generate_unfiltered(rules):
+            if len(candidate) in lengths:
+                yield candidate
+
+    def _generate_unfiltered(self, apply_rules: bool) -> Iterator[bytes]:
+        """Stream unique candidates (base words plus mutations)."""
+        seen = BloomFilter(self._estimate_word_count())
+        if apply_rules and _cmutations is not None:
+            # One C call returning a list per word: the generator
+            # boundary is crossed once per word, not once per mutation.
+            mutate_all = _cmutations.mutate_all
+            suffixes = self.COMMON_SUFFIXES
+            prefixes = self.COMMON_PREFIXES
+            table = self._LEET_TABLE
+            for word in self._iter_words(seen):
+                yield word
+                yield from mutate_all(word, suffixes, prefixes, table)
+            return
+        if apply_rules and _kernels.HAVE_NUMBA:
+            yield from self._generate_batched(seen)
+            return
+        for word in self._iter_words(seen):
+            yield word
+            if apply_rules:
+                yield from self._apply_mutations(word)
+
+    def _generate_batched(self, seen: BloomFilter) -> Iterator[bytes]:
+        """Numba path: run mutation kernels over chunks of packed words."""
+        chunk = []
+        for word in self._iter_words(seen):
+            yield word
+            chunk.append(word)
+            if len(chunk) >= _kernels.CHUNK_SIZE:
+                yield from self._mutate_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self._mutate_chunk(chunk)
+
+    def _mutate_chunk(self, words) -> Iterator[bytes]:
+        """Yield mutations for a chunk, one kernel dispatch per family.
+
+        Case transforms stay in Python (``bytes.lower`` etc. are already
+        C-level); the per-character leetspeak translate and the affix
+        concatenations run as parallel kernels over the packed buffer.
+        """
+        import numpy as np
+
+        for word in words:
+            lower = word.lower()
+            if lower != word:
+                yield lower
+            upper = word.upper()
+            if upper != word and upper != lower:
+                yield upper
+            capitalized = word.capitalize()
+            if (capitalized != word and capitalized != lower
+                    and capitalized != upper):
+                yield capitalized
+
+        buf, offsets = _kernels.pack_words(words)
+
+        # Leet translate: output buffer leads with the 256-entry table.
+        out = np.empty(256 + buf.shape[0], dtype=np.uint8)
+        out[:256] = np.frombuffer(self._LEET_TABLE, dtype=np.uint8)
+        _kernels.leet_translate(buf, offsets, out)
+        data = out.tobytes()
+        for i, word in enumerate(words):
+            mutation = data[256 + offsets[i]:256 + offsets[i + 1]]
+            if mutation != word:
+                yield mutation
+
+        for affixes, kernel in ((self.COMMON_SUFFIXES, _kernels.append_suffix),
+                                (self.COMMON_PREFIXES, _kernels.prepend_prefix)):
+            for affix in affixes:
+                affix_arr = np.frombuffer(affix, dtype=np.uint8)
+                extra = len(affix)
+                out_off = _kernels.affix_offsets(offsets, extra)
+                out = np.empty(buf.shape[0] + len(words) * extra,
+                               dtype=np.uint8)
+                kernel(buf, offsets, affix_arr, out, out_off)
+                data = out.tobytes()
+                is_prefix = kernel is _kernels.prepend_prefix
+                for i in range(len(words)):
+                    start = out_off[i]
+                    mutation = data[start:start + (offsets[i + 1] - offsets[i]) + extra]
+                    # Mirror the pure path: prefixes that commute with
+                    # the word already went out as suffix variants.
+                    if is_prefix and mutation == words[i] + affix:
+                        continue
+                    yield mutation
+
+    def _apply_mutations(self, word: bytes) -> Iterator[bytes]:
+        """Yield each distinct variant of ``word`` exactly once.
+
+        Case rules form equivalence classes: a variant is emitted only
+        when it differs from the base word and from every variant
+        already emitted, so no runtime dedup structure is needed.
+        Affixed variants are longer than the base by construction and
+        never collide with it or the case variants.
+        """
+        lower = word.lower()
+        if lower != word:
+            yield lower
+        upper = word.upper()
+        if upper != word and upper != lower:
+            yield upper
+        capitalized = word.capitalize()
+        if capitalized != word and capitalized != lower and capitalized != upper:
+            yield capitalized
+        leet = word.translate(self._LEET_TABLE)
+        if leet != word:
+            yield leet
+
+        n = len(word)
+        pad = self._prefix_pad
+        scratch = self._scratch
+        if pad + n + self._max_suffix > len(scratch):
+            self._scratch = scratch = bytearray(pad + n + self._max_suffix + 256)
+        view = memoryview(scratch)
+        word_view = view[pad:pad + n]
+        word_view[:] = word
+        for suffix, k in self._suffix_items:
+            end = pad + n + k
+            view[pad + n:end] = suffix
+            yield bytes(view[pad:end])
+        for prefix, k in self._prefix_items:
+            start = pad - k
+            view[start:pad] = prefix
+            prefixed = view[start:pad + n]
+            # Every prefix also appears as a suffix, so skip words that
+            # commute with the affix (e.g. b'123' + b'123'); the check
+            # compares buffer views, allocating nothing.
+            if prefixed[:n] == word_view and prefixed[n:] == prefix:
+                continue
+            yield bytes(prefixed)
+
+    @property
+    def _stats_cache_path(self) -> str:
+        return self.wordlist_path + '.stats.json'
+
+    def _wordlist_signature(self) -> Optional[Dict[str, Any]]:
+        try:
+            st = os.stat(self.wordlist_path)
+        except OSError:
+            return None
+        return {'mtime': st.st_mtime, 'size': st.st_size}
+
+    def _store_stats(self, stats: Dict[str, Any]) -> None:
+        """Record a completed scan in memory and in the sidecar cache."""
+        self._wordlist_stats = stats
+        signature = self._wordlist_signature()
+        if signature is None:
+            return
+        try:
+            with open(self._stats_cache_path, 'w', encoding='utf-8') as f:
+                json.dump({**signature, 'stats': stats}, f)
+        except OSError:
+            pass
+
+    def _load_cached_stats(self) -> Optional[Dict[str, Any]]:
+        """Return sidecar stats if they match the wordlist's mtime/size."""
+        signature = self._wordlist_signature()
+        if signature is None:
+            return None
+        try:
+            with open(self._stats_cache_path, encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (cached.get('mtime') == signature['mtime']
+                and cached.get('size') == signature['size']):
+            return cached.get('stats')
+        return None
+
+    def _mutations_by_length(self, word: bytes) -> Dict[int, List[bytes]]:
+        """All mutations of ``word`` bucketed by candidate length.
+
+        The per-length layout feeds same-length lanes into batched hash
+        primitives directly; see ``generate_length_batches`` on the base
+        class for the stream-level equivalent.
+        """
+        buckets: Dict[int, List[bytes]] = {}
+        for mutation in self._apply_mutations(word):
+            buckets.setdefault(len(mutation), []).append(mutation)
+        return buckets
+
+    def get_wordlist_stats(self) -> Dict[str, Any]:
+        """Report wordlist size statistics, scanning at most once.
+
+        Resolution order: stats collected by a prior full generation
+        pass, then the ``<path>.stats.json`` sidecar (keyed by the
+        wordlist's mtime and size), then a dedicated scan.
+        """
+        if self._wordlist_stats is not None:
+            return self._wordlist_stats
+        cached = self._load_cached_stats()
+        if cached is not None:
+            self._wordlist_stats = cached
+            return cached
+        for _ in self._iter_words(BloomFilter(self._estimate_word_count())):
+            pass
+        return self._wordlist_stats
+
+    def get_info(self) -> Dict[str, Any]:
+        """Return a description of this attack's configuration."""
+        return {
+            'name': self.name,
+            'wordlist': self.wordlist_path,
+            'apply_rules': self.apply_rules,
+        }
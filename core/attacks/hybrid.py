@@ -0,0 +1,134 @@
+"""Hybrid attack combining a dictionary with a brute-force mask."""
+
+import itertools
+from typing import Any, Dict, Iterator, List, Optional
+
+from .base import AttackStrategy
+from .brute_force import BruteForceAttack
+from .dictionary import DictionaryAttack
+
+
+class HybridAttack(AttackStrategy):
+    """Dictionary words combined with mask-generated affixes.
+
+    ``append`` mode yields ``word + mask_part``, ``prepend`` yields
+    ``mask_part + word``, ``both`` chains the two passes and
+    ``rules_brute`` runs the rule-mutated dictionary followed by the
+    raw brute-force keyspace.  The
+    combined keyspace is never materialized: both sides stream, and
+    whichever side is smaller is cached in RAM so the larger side is
+    read exactly once.  Memory stays O(min(|dict|, |mask|)) instead of
+    O(|mask|) per word.
+    """
+
+    #: Largest keyspace side we are willing to cache as a list.
+    _CACHE_LIMIT = 10 ** 7
+
+    def __init__(self,
+                 dictionary_attack: DictionaryAttack,
+                 brute_force_attack: BruteForceAttack,
+                 mode: str = 'append',
+                 lengths: Optional[Any] = None) -> None:
+        super().__init__()
+        if mode not in ('append', 'prepend', 'both', 'rules_brute'):
+            raise ValueError(f"Unknown hybrid mode: {mode}")
+        self.name = 'hybrid'
+        self.dictionary_attack = dictionary_attack
+        self.brute_force_attack = brute_force_attack
+        self.mode = mode
+        # Optional candidate-length whitelist, as on DictionaryAttack.
+        self.lengths = frozenset(lengths) if lengths is not None else None
+
+    def to_config(self) -> Dict[str, Any]:
+        """Constructor arguments needed to rebuild this strategy."""
+        return {
+            'dictionary': self.dictionary_attack.to_config(),
+            'brute_force': self.brute_force_attack.to_config(),
+            'mode': self.mode,
+            'lengths': sorted(self.lengths) if self.lengths is not None else None,
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'HybridAttack':
+        """Rebuild a strategy from :meth:`to_config` output."""
+        return cls(DictionaryAttack.from_config(config['dictionary']),
+                   BruteForceAttack.from_config(config['brute_force']),
+                   config['mode'], config.get('lengths'))
+
+    def generate_candidates(self) -> Iterator[bytes]:
+        """Stream combinations, length-filtered when configured."""
+        if self.lengths is None:
+            yield from self._generate_unfiltered()
+            return
+        lengths = self.lengths
+        for candidate in self._generate_unfiltered():
+            if len(candidate) in lengths:
+                yield candidate
+
+    def _generate_unfiltered(self) -> Iterator[bytes]:
+        """Stream word/mask combinations without materializing either side."""
+        if self.mode == 'append':
+            yield from self._dictionary_mask_hybrid()
+        elif self.mode == 'prepend':
+            yield from self._mask_dictionary_hybrid()
+        elif self.mode == 'rules_brute':
+            yield from self._rules_brute_hybrid()
+        else:
+            yield from itertools.chain(self._dictionary_mask_hybrid(),
+                                       self._mask_dictionary_hybrid())
+
+    def _mask_fits_in_ram(self) -> bool:
+        return self.brute_force_attack.total_combinations <= self._CACHE_LIMIT
+
+    def _cached_mask_parts(self) -> List[bytes]:
+        return list(self.brute_force_attack.iter_candidates())
+
+    def _dictionary_mask_hybrid(self) -> Iterator[bytes]:
+        """Yield ``word + mask_part`` with the smaller side cached."""
+        if self._mask_fits_in_ram():
+            mask_parts = self._cached_mask_parts()
+            for word in self.dictionary_attack.generate_candidates():
+                for mask_part in mask_parts:
+                    yield word + mask_part
+        else:
+            # Mask space too large to cache: invert the loops so the
+            # (typically far smaller) dictionary is held in RAM and the
+            # mask streams exactly once.
+            words = list(self.dictionary_attack.generate_candidates())
+            for mask_part in self.brute_force_attack.iter_candidates():
+                for word in words:
+                    yield word + mask_part
+
+    def _mask_dictionary_hybrid(self) -> Iterator[bytes]:
+        """Yield ``mask_part + word`` with the smaller side cached."""
+        if self._mask_fits_in_ram():
+            mask_parts = self._cached_mask_parts()
+            for word in self.dictionary_attack.generate_candidates():
+                for mask_part in mask_parts:
+                    yield mask_part + word
+        else:
+            words = list(self.dictionary_attack.generate_candidates())
+            for mask_part in self.brute_force_attack.iter_candidates():
+                for word in words:
+                    yield mask_part + word
+
+    def _rules_brute_hybrid(self) -> Iterator[bytes]:
+        """Full rule-mutated dictionary pass, then the brute-force space.
+
+        Reuses the existing dictionary instance with its per-call
+        ``apply_rules`` override — no second attack object, no second
+        Bloom filter bring-up — and fuses the two passes with
+        ``itertools.chain`` so sharding sees a single producer.
+        """
+        return itertools.chain(
+            self.dictionary_attack.generate_candidates(apply_rules=True),
+            self.brute_force_attack.iter_candidates())
+
+    def get_info(self) -> Dict[str, Any]:
+        """Return a description of this attack's configuration."""
+        return {
+            'name': self.name,
+            'mode': self.mode,
+            'dictionary': self.dictionary_attack.get_info(),
+            'brute_force': self.brute_force_attack.get_info(),
+        }
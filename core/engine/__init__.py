@@ -0,0 +1,7 @@
+"""Cracking engine and work scheduling."""
+
+from .cracking_engine import CrackingEngine, CrackingResult, ProgressStats
+from .task_scheduler import Task, TaskScheduler
+
+__all__ = ['CrackingEngine', 'CrackingResult', 'ProgressStats',
+           'Task', 'TaskScheduler']
@@ -0,0 +1,403 @@
+"""Cracking engine: drives attack strategies against a target hash."""
+
+import ctypes
+import multiprocessing as mp
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from . import gpu_backend
+
+
+#: How many candidates a shard worker hashes between stop-event checks
+#: and stats reports.  A report is one shared-memory store, so this can
+#: sit at one verify batch for responsive progress and stop latency.
+_WORKER_REPORT_INTERVAL = 4096
+
+#: Candidates a shard worker accumulates per verify_batch call.
+_WORKER_BATCH_SIZE = 4096
+
+#: Shared buffer size for the found password (includes a NUL terminator).
+_FOUND_BUF_SIZE = 256
+
+
+def _shard_worker(strategy_cls: Any, attack_config: Dict[str, Any],
+                  target_hash: str, hash_algorithm: Any, shard_id: int,
+                  num_shards: int, stop_flag: Any, found_event: Any,
+                  found_buf: Any, attempt_counters: Any) -> None:
+    """Worker entry point: hash one shard of the keyspace.
+
+    The worker receives a shard descriptor — strategy class, its
+    ``to_config()`` dict and the target — and rebuilds its own generator
+    locally, so nothing proportional to the keyspace crosses the process
+    boundary.  Progress is published by storing the worker's absolute
+    attempt count into its own slot of the shared ``attempt_counters``
+    array — a plain memory write, no pickle or pipe.  ``stop_flag`` is a
+    RawValue byte: checking it is an untracked memory read (an Event
+    would acquire a semaphore per check) and it is amortized over one
+    verify batch anyway.  A hit is published by writing the password
+    into the shared ``found_buf`` and setting ``found_event``; no queue
+    exists on this path at all.
+    """
+    attack_strategy = strategy_cls.from_config(attack_config)
+    attack_strategy.set_target(target_hash, hash_algorithm)
+    target_digest = attack_strategy._prepared_target
+    iter_blocks = getattr(attack_strategy, 'iter_shard_blocks', None)
+    if iter_blocks is not None:
+        # Block path: the strategy packs fixed-length candidates into
+        # contiguous buffers, so no per-candidate object crosses from
+        # generation to verification.
+        verify_block = hash_algorithm.verify_block
+        attempts = 0
+        for row_len, block in iter_blocks(shard_id, num_shards,
+                                          _WORKER_BATCH_SIZE):
+            hit = verify_block(block, row_len, target_digest)
+            if hit >= 0:
+                attempt_counters[shard_id] = attempts + hit + 1
+                start = hit * row_len
+                found_buf.value = block[start:start + row_len][:_FOUND_BUF_SIZE - 1]
+                found_event.set()
+                stop_flag.value = 1
+                return
+            attempts += len(block) // row_len
+            attempt_counters[shard_id] = attempts
+            if stop_flag.value:
+                return
+        attempt_counters[shard_id] = attempts
+        return
+    verify_batch = hash_algorithm.verify_batch
+    attempts = 0
+    reported = 0
+    batch: list = []
+    append = batch.append
+    for candidate in attack_strategy.iter_shard(shard_id, num_shards):
+        append(candidate)
+        if len(batch) < _WORKER_BATCH_SIZE:
+            continue
+        hit = verify_batch(batch, target_digest)
+        if hit >= 0:
+            attempts += hit + 1
+            attempt_counters[shard_id] = attempts
+            found_buf.value = batch[hit][:_FOUND_BUF_SIZE - 1]
+            found_event.set()
+            stop_flag.value = 1
+            return
+        attempts += len(batch)
+        batch = []
+        append = batch.append
+        if attempts - reported >= _WORKER_REPORT_INTERVAL:
+            attempt_counters[shard_id] = attempts
+            reported = attempts
+            if stop_flag.value:
+                return
+    if batch:
+        hit = verify_batch(batch, target_digest)
+        if hit >= 0:
+            attempt_counters[shard_id] = attempts + hit + 1
+            found_buf.value = batch[hit][:_FOUND_BUF_SIZE - 1]
+            found_event.set()
+            stop_flag.value = 1
+            return
+        attempts += len(batch)
+    attempt_counters[shard_id] = attempts
+
+
+class ProgressStats:
+    """Mutable progress snapshot passed to the progress callback.
+
+    A single slotted instance is reused across the whole run, so the
+    callback path allocates nothing per tick.
+    """
+
+    __slots__ = ('attempts', 'elapsed_time', 'workers_active', 'current_hps')
+
+    def __init__(self) -> None:
+        self.attempts = 0
+        self.elapsed_time = 0.0
+        self.workers_active = 0
+        #: Exponential moving average of the live hash rate, so UIs get
+        #: a responsive throughput figure without recomputing it.
+        self.current_hps = 0.0
+
+
+class CrackingResult:
+    """Outcome of a cracking run."""
+
+    def __init__(self,
+                 success: bool,
+                 password: Optional[str] = None,
+                 attempts: int = 0,
+                 elapsed_time: float = 0.0) -> None:
+        self.success = success
+        self.password = password
+        self.attempts = attempts
+        self.elapsed_time = elapsed_time
+        self.hashes_per_second = attempts / elapsed_time if elapsed_time > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'success': self.success,
+            'password': self.password,
+            'attempts': self.attempts,
+            'elapsed_time': self.elapsed_time,
+            'hashes_per_second': self.hashes_per_second,
+        }
+
+
+class CrackingEngine:
+    """Runs an attack strategy's candidate stream against a target hash.
+
+    Candidates are consumed in batches so verification is one Python call
+    per batch rather than one generator resume plus one hash-object
+    round-trip per candidate.
+    """
+
+    #: Attempts accumulated locally before flushing to the strategy.
+    ATTEMPT_FLUSH_INTERVAL = 4096
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> None:
+        # Resolved here, not at CLI parser build, so --help never pays
+        # for the probe and explicit 0/None both mean "use all cores".
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.progress_callback = progress_callback
+        self._progress_stats = ProgressStats()
+        self._ema_hps = 0.0
+        self._last_report_attempts = 0
+        self._last_report_time = 0.0
+
+    def crack_hash(self,
+                   target_hash: str,
+                   hash_algorithm: Any,
+                   attack_strategy: Any,
+                   timeout: Optional[float] = None) -> CrackingResult:
+        """Attempt to recover the password behind ``target_hash``."""
+        attack_strategy.set_target(target_hash, hash_algorithm)
+        start_time = time.time()
+        self._ema_hps = 0.0
+        self._last_report_attempts = 0
+        self._last_report_time = start_time
+
+        gpu_result = self._try_crack_gpu(hash_algorithm, attack_strategy,
+                                         start_time, timeout)
+        if gpu_result is not None:
+            return gpu_result
+
+        attack_config = None
+        if self.max_workers > 1 and hash_algorithm.supports_batch:
+            try:
+                attack_config = attack_strategy.to_config()
+            except NotImplementedError:
+                pass
+
+        if attack_config is not None:
+            result = self._crack_parallel(hash_algorithm, attack_strategy,
+                                          attack_config, start_time, timeout)
+        elif hash_algorithm.supports_batch:
+            result = self._crack_batched(hash_algorithm, attack_strategy,
+                                         start_time, timeout)
+        else:
+            result = self._crack_serial(attack_strategy, start_time, timeout)
+        return result
+
+    def _try_crack_gpu(self, hash_algorithm: Any, attack_strategy: Any,
+                       start_time: float,
+                       timeout: Optional[float]) -> Optional[CrackingResult]:
+        """Route mask-style MD5 attacks to the CUDA backend when present.
+
+        Returns None (falling through to the CPU paths) unless the
+        backend is available, has passed its known-digest self-test,
+        and the strategy exposes a per-position character-set list —
+        the shape the index-decoding kernel needs.  A backend that
+        fails mid-search also falls through: only a verified, completed
+        GPU sweep may report a definitive not-found.
+        """
+        if not gpu_backend.HAVE_CUDA or hash_algorithm.name != 'md5':
+            return None
+        charsets = getattr(attack_strategy, 'character_set', None)
+        if not isinstance(charsets, list):
+            return None
+        if not gpu_backend.self_test():
+            return None
+        deadline = start_time + timeout if timeout else None
+        try:
+            hit, searched = gpu_backend.crack_mask_md5(
+                charsets, 0, attack_strategy.total_combinations,
+                attack_strategy._prepared_target, deadline=deadline)
+        except Exception:
+            return None
+        attack_strategy.add_attempts(searched)
+        elapsed = time.time() - start_time
+        if hit is None:
+            return CrackingResult(False, None, searched, elapsed)
+        candidate = next(attack_strategy.iter_range(hit, hit + 1))
+        return CrackingResult(True, candidate.decode('utf-8', errors='replace'),
+                              searched, elapsed)
+
+    def _crack_parallel(self, hash_algorithm: Any, attack_strategy: Any,
+                        attack_config: Dict[str, Any], start_time: float,
+                        timeout: Optional[float]) -> CrackingResult:
+        """Shard the keyspace across worker processes.
+
+        Each worker enumerates its own slice via ``iter_shard`` — no work
+        chunks cross the process boundary — and a shared byte flag stops
+        the others as soon as one finds the password.  Progress flows
+        through a lock-free shared counter array (one slot per worker,
+        summed here).  A hit lands in a shared char buffer guarded by an
+        event; the finder also raises the stop flag itself, so nothing
+        here is latency-critical.  The main thread therefore does not poll at
+        all: a monitor thread joins the workers and wakes it when they
+        are gone, progress reporting runs on its own half-second tick,
+        and the main thread just blocks (with the run timeout as its
+        wait bound).
+        """
+        # Prefer fork where available: workers inherit the parsed modules
+        # and the strategy class by COW page instead of re-importing (and
+        # re-pickling arguments) under spawn.  The per-worker payload is
+        # already O(1) — a config dict, not candidates — so fork only
+        # trims startup, not steady-state traffic.
+        if 'fork' in mp.get_all_start_methods():
+            ctx = mp.get_context('fork')
+        else:
+            ctx = mp.get_context()
+        # A RawValue byte, not an Event: workers read it per batch and a
+        # plain shared-memory write suffices to raise it, with no
+        # semaphore round-trip on either side.
+        stop_flag = ctx.RawValue(ctypes.c_byte, 0)
+        found_event = ctx.Event()
+        found_buf = ctx.Array(ctypes.c_char, _FOUND_BUF_SIZE)
+        attempt_counters = ctx.RawArray('Q', self.max_workers)
+        workers = [
+            ctx.Process(target=_shard_worker,
+                        args=(type(attack_strategy), attack_config,
+                              attack_strategy.target_hash, hash_algorithm,
+                              shard_id, self.max_workers, stop_flag,
+                              found_event, found_buf, attempt_counters),
+                        daemon=True)
+            for shard_id in range(self.max_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        workers_done = threading.Event()
+
+        def _join_workers() -> None:
+            for worker in workers:
+                worker.join()
+            workers_done.set()
+
+        def _progress_loop() -> None:
+            while not workers_done.wait(0.5):
+                self._report_progress(sum(attempt_counters), start_time,
+                                      sum(1 for w in workers if w.is_alive()))
+
+        monitor = threading.Thread(target=_join_workers, daemon=True)
+        monitor.start()
+        if self.progress_callback is not None:
+            threading.Thread(target=_progress_loop, daemon=True).start()
+
+        try:
+            workers_done.wait(timeout)
+        finally:
+            stop_flag.value = 1
+            monitor.join()
+
+        found: Optional[bytes] = found_buf.value if found_event.is_set() else None
+        total_attempts = sum(attempt_counters)
+        attack_strategy.add_attempts(total_attempts)
+
+        elapsed = time.time() - start_time
+        if found is not None:
+            return CrackingResult(True, found.decode('utf-8', errors='replace'),
+                                  total_attempts, elapsed)
+        # Workers have no other error channel: a shard that died (bad
+        # wordlist path, OOM kill, ...) left its keyspace unsearched, so
+        # reporting not-found here would dress a crashed run up as an
+        # exhausted one.
+        crashed = sorted({worker.exitcode for worker in workers
+                          if worker.exitcode})
+        if crashed:
+            raise RuntimeError(
+                f"{sum(1 for w in workers if w.exitcode)} of "
+                f"{len(workers)} workers exited abnormally "
+                f"(exit codes {crashed}); keyspace not exhausted")
+        return CrackingResult(False, None, total_attempts, elapsed)
+
+    def _crack_batched(self, hash_algorithm: Any, attack_strategy: Any,
+                       start_time: float, timeout: Optional[float]) -> CrackingResult:
+        """Fused generate+verify loop over candidate batches."""
+        target_digest = attack_strategy._prepared_target
+        attempts = 0
+        flushed = 0
+        for batch in attack_strategy.generate_batches():
+            hit = hash_algorithm.verify_batch(batch, target_digest)
+            if hit >= 0:
+                attempts += hit + 1
+                attack_strategy.add_attempts(attempts - flushed)
+                password = batch[hit].decode('utf-8', errors='replace')
+                return CrackingResult(True, password, attempts,
+                                      time.time() - start_time)
+            attempts += len(batch)
+            if attempts - flushed >= self.ATTEMPT_FLUSH_INTERVAL:
+                attack_strategy.add_attempts(attempts - flushed)
+                flushed = attempts
+            now = time.time()
+            if timeout and now - start_time > timeout:
+                break
+            self._report_progress(attempts, start_time, now=now)
+        attack_strategy.add_attempts(attempts - flushed)
+        return CrackingResult(False, None, attempts, time.time() - start_time)
+
+    def _crack_serial(self, attack_strategy: Any, start_time: float,
+                      timeout: Optional[float]) -> CrackingResult:
+        """Per-candidate loop for salted, verification-only algorithms."""
+        verify = attack_strategy.hash_algorithm.verify_prepared
+        target = attack_strategy._prepared_target
+        flush_interval = self.ATTEMPT_FLUSH_INTERVAL
+        local_attempts = 0
+        flushed = 0
+        for candidate in attack_strategy.generate_candidates():
+            local_attempts += 1
+            if verify(candidate, target):
+                attack_strategy.add_attempts(local_attempts - flushed)
+                if isinstance(candidate, bytes):
+                    candidate = candidate.decode('utf-8', errors='replace')
+                return CrackingResult(True, candidate, local_attempts,
+                                      time.time() - start_time)
+            if local_attempts - flushed >= flush_interval:
+                attack_strategy.add_attempts(local_attempts - flushed)
+                flushed = local_attempts
+            # Salted algorithms are slow per call, so the clock check per
+            # candidate is noise next to the verification itself.
+            now = time.time()
+            if timeout and now - start_time > timeout:
+                break
+            self._report_progress(local_attempts, start_time, now=now)
+        attack_strategy.add_attempts(local_attempts - flushed)
+        return CrackingResult(False, None, local_attempts,
+                              time.time() - start_time)
+
+    #: EMA smoothing factor for the live hash rate.
+    _HPS_EMA_ALPHA = 0.3
+
+    def _report_progress(self, attempts: int, start_time: float,
+                         workers_active: int = 0,
+                         now: Optional[float] = None) -> None:
+        if self.progress_callback:
+            if now is None:
+                now = time.time()
+            interval = now - self._last_report_time
+            if interval > 0:
+                instant = (attempts - self._last_report_attempts) / interval
+                self._ema_hps = (self._HPS_EMA_ALPHA * instant
+                                 + (1.0 - self._HPS_EMA_ALPHA) * self._ema_hps)
+                self._last_report_attempts = attempts
+                self._last_report_time = now
+            stats = self._progress_stats
+            stats.attempts = attempts
+            stats.elapsed_time = now - start_time
+            stats.workers_active = workers_active
+            stats.current_hps = self._ema_hps
+            self.progress_callback(stats)
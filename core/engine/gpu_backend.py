@@ -0,0 +1,187 @@
+"""Optional CUDA backend for mask-based MD5 cracking.
+
+Mask brute force is embarrassingly data-parallel: every candidate is an
+independent index in the mixed-radix keyspace, so each GPU thread can
+decode its own index into a candidate, hash it, and compare against the
+target without touching any other thread.  Requires ``numba`` with a
+working CUDA toolkit and device; when either is missing ``HAVE_CUDA``
+is False and the engine never routes here.
+
+Only single-block MD5 (masks up to 55 positions — i.e. all of them) is
+implemented: MD5 is the algorithm where the CPU side is most thoroughly
+outclassed, and the index-decode scaffolding generalizes if other
+digests grow kernels later.
+"""
+
+import hashlib
+import time
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+    from numba import cuda, uint32
+    HAVE_CUDA = cuda.is_available()
+except Exception:  # numba missing, or CUDA driver probe failed
+    np = None
+    cuda = None
+    HAVE_CUDA = False
+
+#: Candidates per kernel launch.
+LAUNCH_SIZE = 1 << 22
+_THREADS_PER_BLOCK = 256
+
+if HAVE_CUDA:
+    _K = np.array([
+        0xd76aa478, 0xe8c7b756, 0x242070db, 0xc1bdceee,
+        0xf57c0faf, 0x4787c62a, 0xa8304613, 0xfd469501,
+        0x698098d8, 0x8b44f7af, 0xffff5bb1, 0x895cd7be,
+        0x6b901122, 0xfd987193, 0xa679438e, 0x49b40821,
+        0xf61e2562, 0xc040b340, 0x265e5a51, 0xe9b6c7aa,
+        0xd62f105d, 0x02441453, 0xd8a1e681, 0xe7d3fbc8,
+        0x21e1cde6, 0xc33707d6, 0xf4d50d87, 0x455a14ed,
+        0xa9e3e905, 0xfcefa3f8, 0x676f02d9, 0x8d2a4c8a,
+        0xfffa3942, 0x8771f681, 0x6d9d6122, 0xfde5380c,
+        0xa4beea44, 0x4bdecfa9, 0xf6bb4b60, 0xbebfbc70,
+        0x289b7ec6, 0xeaa127fa, 0xd4ef3085, 0x04881d05,
+        0xd9d4d039, 0xe6db99e5, 0x1fa27cf8, 0xc4ac5665,
+        0xf4292244, 0x432aff97, 0xab9423a7, 0xfc93a039,
+        0x655b59c3, 0x8f0ccc92, 0xffeff47d, 0x85845dd1,
+        0x6fa87e4f, 0xfe2ce6e0, 0xa3014314, 0x4e0811a1,
+        0xf7537e82, 0xbd3af235, 0x2ad7d2bb, 0xeb86d391,
+    ], dtype=np.uint32)
+    _S = np.array([
+        7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22,
+        5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20,
+        4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23,
+        6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21,
+    ], dtype=np.uint32)
+
+    @cuda.jit
+    def _md5_mask_kernel(charsets_flat, offsets, radixes, length, start,
+                         count, target, found_index):
+        i = cuda.grid(1)
+        if i >= count or found_index[0] >= 0:
+            return
+        # Decode this thread's keyspace index into a padded MD5 block.
+        msg = cuda.local.array(64, dtype=uint32)
+        for p in range(64):
+            msg[p] = 0
+        rem = start + i
+        for p in range(length - 1, -1, -1):
+            radix = radixes[p]
+            msg[p] = charsets_flat[offsets[p] + rem % radix]
+            rem //= radix
+        msg[length] = 0x80
+        bitlen = length * 8
+        msg[56] = bitlen & 0xFF
+        msg[57] = (bitlen >> 8) & 0xFF
+
+        m = cuda.local.array(16, dtype=uint32)
+        for t in range(16):
+            m[t] = (msg[4 * t] | (msg[4 * t + 1] << 8)
+                    | (msg[4 * t + 2] << 16) | (msg[4 * t + 3] << 24))
+
+        # Numba promotes integer arithmetic to 64 bits (NBEP 1), so
+        # every round value is masked back to 32 — otherwise carries
+        # above 2^32 survive into the rotate and the state words
+        # accumulate garbage, unlike the C kernel's epi32 lanes which
+        # wrap naturally.
+        mask32 = uint32(0xFFFFFFFF)
+        a = uint32(0x67452301)
+        b = uint32(0xefcdab89)
+        c = uint32(0x98badcfe)
+        d = uint32(0x10325476)
+        for r in range(64):
+            if r < 16:
+                f = (b & c) | (~b & d)
+                g = r
+            elif r < 32:
+                f = (d & b) | (~d & c)
+                g = (5 * r + 1) & 15
+            elif r < 48:
+                f = b ^ c ^ d
+                g = (3 * r + 5) & 15
+            else:
+                f = c ^ (b | ~d)
+                g = (7 * r) & 15
+            s = _S[r]
+            total = (a + f + _K[r] + m[g]) & mask32
+            rotated = ((total << s) | (total >> (uint32(32) - s))) & mask32
+            a, d, c, b = d, c, b, (b + rotated) & mask32
+        a = (a + uint32(0x67452301)) & mask32
+        b = (b + uint32(0xefcdab89)) & mask32
+        c = (c + uint32(0x98badcfe)) & mask32
+        d = (d + uint32(0x10325476)) & mask32
+        if (a == target[0] and b == target[1]
+                and c == target[2] and d == target[3]):
+            cuda.atomic.cas(found_index, 0, -1, start + i)
+
+
+#: Tri-state self-test result: None until first probed.
+_verified: Optional[bool] = None
+
+
+def self_test() -> bool:
+    """Verify the kernel against a known digest, once per process.
+
+    Like the CPUID probe guarding the SHA-NI kernel, the backend is
+    only trusted after it has reproduced a digest hashlib agrees with —
+    a miscompiled or misbehaving kernel must demote the engine to the
+    CPU paths, not convert crackable hashes into silent not-founds.
+    """
+    global _verified
+    if _verified is None:
+        if not HAVE_CUDA:
+            _verified = False
+        else:
+            try:
+                # 'c2' sits at index 2 * 3 + 1 = 7 of this keyspace.
+                hit, _ = crack_mask_md5([b'abc', b'123'], 0, 9,
+                                        hashlib.md5(b'c2').digest())
+                _verified = hit == 7
+            except Exception:
+                _verified = False
+    return _verified
+
+
+def crack_mask_md5(charsets: List[bytes], start: int, end: int,
+                   target_digest: bytes,
+                   deadline: Optional[float] = None
+                   ) -> Tuple[Optional[int], int]:
+    """Search keyspace indices ``[start, end)`` on the GPU.
+
+    Returns ``(hit, searched)``: the matching keyspace index (or None)
+    and how many indices were covered before the hit, the end of the
+    range, or ``deadline`` (checked between kernel launches).  Callers
+    decode the index back into the candidate with the CPU mixed-radix
+    counter.
+    """
+    if not HAVE_CUDA:
+        raise RuntimeError("CUDA backend unavailable")
+    flat = np.frombuffer(b''.join(charsets), dtype=np.uint8).astype(np.uint32)
+    offsets = np.zeros(len(charsets), dtype=np.int64)
+    for p in range(1, len(charsets)):
+        offsets[p] = offsets[p - 1] + len(charsets[p - 1])
+    radixes = np.array([len(cs) for cs in charsets], dtype=np.int64)
+    target = np.frombuffer(target_digest, dtype=np.uint32)
+
+    d_flat = cuda.to_device(flat)
+    d_offsets = cuda.to_device(offsets)
+    d_radixes = cuda.to_device(radixes)
+    d_target = cuda.to_device(target)
+    found = cuda.to_device(np.array([-1], dtype=np.int64))
+
+    first = start
+    while start < end:
+        if deadline is not None and time.time() >= deadline:
+            break
+        count = min(LAUNCH_SIZE, end - start)
+        blocks = (count + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+        _md5_mask_kernel[blocks, _THREADS_PER_BLOCK](
+            d_flat, d_offsets, d_radixes, len(charsets), start, count,
+            d_target, found)
+        hit = int(found.copy_to_host()[0])
+        if hit >= 0:
+            return hit, hit - first + 1
+        start += count
+    return None, start - first
@@ -0,0 +1,11 @@
+"""Hash algorithm implementations."""
+
+from .base import HashAlgorithm
+from .standard import MD5Hash, NTLMHash, SHA1Hash, SHA256Hash, SHA512Hash
+from .secure import BcryptHash, PBKDF2Hash
+
+__all__ = [
+    'HashAlgorithm',
+    'MD5Hash', 'SHA1Hash', 'SHA256Hash', 'SHA512Hash', 'NTLMHash',
+    'BcryptHash', 'PBKDF2Hash',
+]
@@ -0,0 +1,51 @@
+"""Pure-Python MD4, used for NTLM when OpenSSL does not provide md4.
+
+Modern OpenSSL builds ship without the legacy md4 provider, so
+``hashlib.new('md4')`` raises.  This minimal implementation covers the
+NTLM use case (digesting short UTF-16LE passwords).
+"""
+
+import struct
+
+
+def _lrot(value: int, count: int) -> int:
+    value &= 0xFFFFFFFF
+    return ((value << count) | (value >> (32 - count))) & 0xFFFFFFFF
+
+
+def md4(data: bytes) -> bytes:
+    """Return the 16-byte MD4 digest of ``data``."""
+    message = bytearray(data)
+    bit_length = (8 * len(message)) & 0xFFFFFFFFFFFFFFFF
+    message.append(0x80)
+    while len(message) % 64 != 56:
+        message.append(0)
+    message += struct.pack('<Q', bit_length)
+
+    a, b, c, d = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476
+
+    for offset in range(0, len(message), 64):
+        x = struct.unpack('<16I', message[offset:offset + 64])
+        aa, bb, cc, dd = a, b, c, d
+
+        # Round 1: F = (b & c) | (~b & d)
+        for i, shift in zip(range(16), (3, 7, 11, 19) * 4):
+            f = (b & c) | (~b & d)
+            a, d, c, b = d, c, b, _lrot(a + f + x[i], shift)
+        # Round 2: G = (b & c) | (b & d) | (c & d)
+        order2 = (0, 4, 8, 12, 1, 5, 9, 13, 2, 6, 10, 14, 3, 7, 11, 15)
+        for i, shift in zip(order2, (3, 5, 9, 13) * 4):
+            g = (b & c) | (b & d) | (c & d)
+            a, d, c, b = d, c, b, _lrot(a + g + x[i] + 0x5A827999, shift)
+        # Round 3: H = b ^ c ^ d
+        order3 = (0, 8, 4, 12, 2, 10, 6, 14, 1, 9, 5, 13, 3, 11, 7, 15)
+        for i, shift in zip(order3, (3, 9, 11, 15) * 4):
+            h = b ^ c ^ d
+            a, d, c, b = d, c, b, _lrot(a + h + x[i] + 0x6ED9EBA1, shift)
+
+        a = (a + aa) & 0xFFFFFFFF
+        b = (b + bb) & 0xFFFFFFFF
+        c = (c + cc) & 0xFFFFFFFF
+        d = (d + dd) & 0xFFFFFFFF
+
+    return struct.pack('<4I', a, b, c, d)
@@ -0,0 +1,139 @@
+/* 8-lane AVX2 MD5: eight independent single-block digests per call.
+ *
+ * Each 32-bit element of a ymm register holds one lane's MD5 state, so
+ * the 64 rounds run once for all eight messages.  Input is eight
+ * pre-padded 64-byte blocks back to back (lane i at in + 64*i); output
+ * is eight 16-byte digests back to back.  Single-block only: callers
+ * must keep messages <= 55 bytes and apply standard MD5 padding.
+ *
+ * Build:
+ *   gcc -O3 -mavx2 -shared -fPIC -o libmd5x8.so md5_x8.c
+ */
+
+#include <immintrin.h>
+#include <stdint.h>
+
+static const uint32_t K[64] = {
+    0xd76aa478, 0xe8c7b756, 0x242070db, 0xc1bdceee,
+    0xf57c0faf, 0x4787c62a, 0xa8304613, 0xfd469501,
+    0x698098d8, 0x8b44f7af, 0xffff5bb1, 0x895cd7be,
+    0x6b901122, 0xfd987193, 0xa679438e, 0x49b40821,
+    0xf61e2562, 0xc040b340, 0x265e5a51, 0xe9b6c7aa,
+    0xd62f105d, 0x02441453, 0xd8a1e681, 0xe7d3fbc8,
+    0x21e1cde6, 0xc33707d6, 0xf4d50d87, 0x455a14ed,
+    0xa9e3e905, 0xfcefa3f8, 0x676f02d9, 0x8d2a4c8a,
+    0xfffa3942, 0x8771f681, 0x6d9d6122, 0xfde5380c,
+    0xa4beea44, 0x4bdecfa9, 0xf6bb4b60, 0xbebfbc70,
+    0x289b7ec6, 0xeaa127fa, 0xd4ef3085, 0x04881d05,
+    0xd9d4d039, 0xe6db99e5, 0x1fa27cf8, 0xc4ac5665,
+    0xf4292244, 0x432aff97, 0xab9423a7, 0xfc93a039,
+    0x655b59c3, 0x8f0ccc92, 0xffeff47d, 0x85845dd1,
+    0x6fa87e4f, 0xfe2ce6e0, 0xa3014314, 0x4e0811a1,
+    0xf7537e82, 0xbd3af235, 0x2ad7d2bb, 0xeb86d391
+};
+
+static const int S[64] = {
+    7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22,
+    5,  9, 14, 20, 5,  9, 14, 20, 5,  9, 14, 20, 5,  9, 14, 20,
+    4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23,
+    6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21
+};
+
+static inline __m256i rotl(__m256i x, int s)
+{
+    return _mm256_or_si256(_mm256_sll_epi32(x, _mm_cvtsi32_si128(s)),
+                           _mm256_srl_epi32(x, _mm_cvtsi32_si128(32 - s)));
+}
+
+static void md5_x8_core(const uint8_t *in, uint32_t ra[8], uint32_t rb[8],
+                        uint32_t rc[8], uint32_t rd[8])
+{
+    __m256i M[16];
+    for (int t = 0; t < 16; t++) {
+        M[t] = _mm256_set_epi32(
+            *(const uint32_t *)(in + 7 * 64 + 4 * t),
+            *(const uint32_t *)(in + 6 * 64 + 4 * t),
+            *(const uint32_t *)(in + 5 * 64 + 4 * t),
+            *(const uint32_t *)(in + 4 * 64 + 4 * t),
+            *(const uint32_t *)(in + 3 * 64 + 4 * t),
+            *(const uint32_t *)(in + 2 * 64 + 4 * t),
+            *(const uint32_t *)(in + 1 * 64 + 4 * t),
+            *(const uint32_t *)(in + 0 * 64 + 4 * t));
+    }
+
+    const __m256i a0 = _mm256_set1_epi32((int) 0x67452301);
+    const __m256i b0 = _mm256_set1_epi32((int) 0xefcdab89);
+    const __m256i c0 = _mm256_set1_epi32((int) 0x98badcfe);
+    const __m256i d0 = _mm256_set1_epi32((int) 0x10325476);
+    const __m256i ones = _mm256_set1_epi32(-1);
+    __m256i a = a0, b = b0, c = c0, d = d0;
+
+    for (int i = 0; i < 64; i++) {
+        __m256i f;
+        int g;
+        if (i < 16) {
+            f = _mm256_or_si256(_mm256_and_si256(b, c),
+                                _mm256_andnot_si256(b, d));
+            g = i;
+        } else if (i < 32) {
+            f = _mm256_or_si256(_mm256_and_si256(d, b),
+                                _mm256_andnot_si256(d, c));
+            g = (5 * i + 1) & 15;
+        } else if (i < 48) {
+            f = _mm256_xor_si256(_mm256_xor_si256(b, c), d);
+            g = (3 * i + 5) & 15;
+        } else {
+            f = _mm256_xor_si256(c,
+                    _mm256_or_si256(b, _mm256_xor_si256(d, ones)));
+            g = (7 * i) & 15;
+        }
+        __m256i sum = _mm256_add_epi32(
+            _mm256_add_epi32(a, f),
+            _mm256_add_epi32(_mm256_set1_epi32((int) K[i]), M[g]));
+        __m256i next_b = _mm256_add_epi32(b, rotl(sum, S[i]));
+        a = d;
+        d = c;
+        c = b;
+        b = next_b;
+    }
+
+    _mm256_storeu_si256((__m256i *) ra, _mm256_add_epi32(a, a0));
+    _mm256_storeu_si256((__m256i *) rb, _mm256_add_epi32(b, b0));
+    _mm256_storeu_si256((__m256i *) rc, _mm256_add_epi32(c, c0));
+    _mm256_storeu_si256((__m256i *) rd, _mm256_add_epi32(d, d0));
+}
+
+void md5_x8(const uint8_t *in, uint8_t *out)
+{
+    uint32_t ra[8], rb[8], rc[8], rd[8];
+    md5_x8_core(in, ra, rb, rc, rd);
+    for (int l = 0; l < 8; l++) {
+        uint32_t *o = (uint32_t *) (out + 16 * l);
+        o[0] = ra[l];
+        o[1] = rb[l];
+        o[2] = rc[l];
+        o[3] = rd[l];
+    }
+}
+
+/* Digest eight blocks and compare against a 16-byte target digest.
+ * Returns the matching lane (0-7) or -1.  The low 64 bits of each
+ * lane's digest are prefiltered against the target's first 8 bytes, so
+ * the almost-always miss case is one predicted-not-taken compare per
+ * lane and no digest bytes leave this function. */
+int md5_x8_match(const uint8_t *in, const uint8_t *target)
+{
+    uint32_t ra[8], rb[8], rc[8], rd[8];
+    uint32_t t[4];
+    uint64_t t_lo;
+    md5_x8_core(in, ra, rb, rc, rd);
+    __builtin_memcpy(t, target, 16);
+    t_lo = (uint64_t) t[0] | ((uint64_t) t[1] << 32);
+    for (int l = 0; l < 8; l++) {
+        uint64_t lo = (uint64_t) ra[l] | ((uint64_t) rb[l] << 32);
+        if (__builtin_expect(lo == t_lo, 0)
+                && rc[l] == t[2] && rd[l] == t[3])
+            return l;
+    }
+    return -1;
+}
@@ -0,0 +1,66 @@
+"""ctypes bindings for the 8-lane AVX2 MD5 kernel.
+
+The kernel lives in ``_simd/md5_x8.c`` and hashes eight independent
+messages per call by keeping one MD5 state per 32-bit SIMD lane.  The
+shared library is not shipped prebuilt — build it next to the source
+with::
+
+    gcc -O3 -mavx2 -shared -fPIC -o libmd5x8.so md5_x8.c
+
+When the library is absent (or ctypes cannot load it), ``HAVE_SIMD`` is
+False and callers fall back to the scalar hashlib path.  The kernel is
+single-block: only messages up to 55 bytes fit one padded MD5 block, so
+:func:`md5_x8_digests` is restricted accordingly — which covers nearly
+every password candidate this tool generates.
+"""
+
+import ctypes
+import os
+import struct
+
+#: Longest message that fits a single padded MD5 block.
+MAX_MESSAGE_LEN = 55
+
+_LIB_PATH = os.path.join(os.path.dirname(__file__), '_simd', 'libmd5x8.so')
+
+try:
+    _lib = ctypes.CDLL(_LIB_PATH)
+    _lib.md5_x8.argtypes = (ctypes.c_char_p, ctypes.c_char_p)
+    _lib.md5_x8.restype = None
+    _lib.md5_x8_match.argtypes = (ctypes.c_char_p, ctypes.c_char_p)
+    _lib.md5_x8_match.restype = ctypes.c_int
+    HAVE_SIMD = True
+except (OSError, AttributeError):
+    _lib = None
+    HAVE_SIMD = False
+
+_pack_bitlen = struct.Struct('<Q').pack
+_ZEROS = bytes(64)
+
+
+def _pad(msg: bytes) -> bytes:
+    """Pad a message (<= 55 bytes) into one 64-byte MD5 block."""
+    return (msg + b'\x80' + _ZEROS[:MAX_MESSAGE_LEN - len(msg)]
+            + _pack_bitlen(len(msg) * 8))
+
+
+def md5_x8_digests(messages) -> bytes:
+    """Digest exactly eight messages of <= 55 bytes each.
+
+    Returns the eight 16-byte digests concatenated in input order.
+    """
+    blocks = b''.join(map(_pad, messages))
+    out = ctypes.create_string_buffer(128)
+    _lib.md5_x8(blocks, out)
+    return out.raw
+
+
+def md5_x8_match(messages, target_digest: bytes) -> int:
+    """Digest eight messages and compare against a 16-byte target in C.
+
+    Returns the index of the matching message, or -1.  The kernel
+    prefilters on the digest's low 64 bits, so misses cost no Python
+    work beyond this call.
+    """
+    blocks = b''.join(map(_pad, messages))
+    return _lib.md5_x8_match(blocks, target_digest)
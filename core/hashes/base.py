@@ -0,0 +1,106 @@
+"""Base class shared by all hash algorithm implementations."""
+
+import hmac
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Union
+
+
+class HashAlgorithm(ABC):
+    """Abstract base class for hash algorithms.
+
+    Fast unsalted algorithms implement :meth:`digest` and inherit the
+    batch verification path; salted verification-only algorithms (bcrypt,
+    PBKDF2) override :meth:`verify` and set ``supports_batch = False``.
+    """
+
+    #: Algorithm identifier used by the CLI (e.g. ``'md5'``).
+    name: str = ''
+    #: Expected length of a hex digest, in characters.
+    hash_length: int = 0
+    #: Whether raw digests can be compared in batch.
+    supports_batch: bool = True
+
+    @abstractmethod
+    def digest(self, data: bytes) -> bytes:
+        """Return the raw digest of ``data``."""
+        raise NotImplementedError
+
+    def hash_password(self, password: Union[str, bytes]) -> str:
+        """Return the hex digest of ``password``."""
+        if isinstance(password, str):
+            password = password.encode('utf-8')
+        return self.digest(password).hex()
+
+    def normalize_hash(self, hash_value: str) -> str:
+        """Canonicalize a user-supplied hash string."""
+        return hash_value.strip().lower()
+
+    def validate_hash(self, hash_value: str) -> bool:
+        """Check that ``hash_value`` looks like a digest of this algorithm."""
+        normalized = self.normalize_hash(hash_value)
+        if len(normalized) != self.hash_length:
+            return False
+        try:
+            bytes.fromhex(normalized)
+        except ValueError:
+            return False
+        return True
+
+    def verify(self, candidate: Union[str, bytes], target_hash: str) -> bool:
+        """Check one candidate against a target hash string.
+
+        One-shot convenience: decodes the target and compares raw digest
+        bytes.  Loops should call :meth:`prepare_target` once and
+        :meth:`verify_prepared` (or :meth:`verify_batch`) per candidate
+        instead, keeping the hex decode out of the hot path.
+        """
+        return self.verify_prepared(candidate, self.prepare_target(target_hash))
+
+    def prepare_target(self, target_hash: str) -> Any:
+        """Convert a target hash to its raw comparison form, once.
+
+        For digest algorithms this is the decoded digest bytes; salted
+        verification-only algorithms override this to return the target
+        string itself.  Callers hoist this out of their hot loops.
+        """
+        return bytes.fromhex(self.normalize_hash(target_hash))
+
+    def verify_prepared(self, candidate: Union[str, bytes], prepared: Any) -> bool:
+        """Fast-path verify against a target prepared by :meth:`prepare_target`."""
+        if isinstance(candidate, str):
+            candidate = candidate.encode('utf-8')
+        return hmac.compare_digest(self.digest(candidate), prepared)
+
+    def verify_batch(self, batch: List[bytes], target_digest: bytes) -> int:
+        """Check a batch of candidates against a raw target digest.
+
+        Returns the index of the first matching candidate, or -1.  The
+        digest function and target are bound to locals so the loop body
+        is two C calls per candidate.
+        """
+        digest = self.digest
+        target = target_digest
+        for i, candidate in enumerate(batch):
+            if digest(candidate) == target:
+                return i
+        return -1
+
+    def verify_block(self, block: bytes, row_len: int,
+                     target_digest: bytes) -> int:
+        """Check a contiguous buffer of fixed-length candidates.
+
+        ``block`` holds candidates back to back, ``row_len`` bytes each.
+        Returns the row index of the first match, or -1.  The default
+        slices rows out and delegates to :meth:`verify_batch`, so SIMD
+        batch overrides apply to block input as well.
+        """
+        batch = [block[i:i + row_len] for i in range(0, len(block), row_len)]
+        return self.verify_batch(batch, target_digest)
+
+    def get_info(self) -> Dict[str, Any]:
+        """Return a description of this algorithm."""
+        return {
+            'name': self.name,
+            'hash_length': self.hash_length,
+            'supports_batch': self.supports_batch,
+        }
@@ -0,0 +1,112 @@
+"""Salted, verification-only hash algorithms (bcrypt, PBKDF2).
+
+These are properly salted, so candidates cannot be precomputed or
+batch-compared against raw digests — each verification re-derives the
+hash with the salt embedded in the target string.
+"""
+
+import base64
+import hashlib
+import hmac
+from typing import Union
+
+from .base import HashAlgorithm
+
+try:
+    import bcrypt
+    HAVE_BCRYPT = True
+except ImportError:
+    bcrypt = None
+    HAVE_BCRYPT = False
+
+
+class BcryptHash(HashAlgorithm):
+    """bcrypt — verification only; requires the optional bcrypt package."""
+
+    name = 'bcrypt'
+    hash_length = 60
+    supports_batch = False
+
+    def digest(self, data: bytes) -> bytes:
+        raise NotImplementedError("bcrypt is salted; use verify() instead")
+
+    def prepare_target(self, target_hash: str):
+        return self.normalize_hash(target_hash)
+
+    def verify_prepared(self, candidate, prepared) -> bool:
+        return self.verify(candidate, prepared)
+
+    def hash_password(self, password: Union[str, bytes]) -> str:
+        if not HAVE_BCRYPT:
+            raise RuntimeError("bcrypt support requires: pip install bcrypt")
+        if isinstance(password, str):
+            password = password.encode('utf-8')
+        return bcrypt.hashpw(password, bcrypt.gensalt()).decode('ascii')
+
+    def normalize_hash(self, hash_value: str) -> str:
+        # bcrypt strings are case-sensitive; only strip whitespace.
+        return hash_value.strip()
+
+    def validate_hash(self, hash_value: str) -> bool:
+        return hash_value.strip().startswith(('$2a$', '$2b$', '$2y$'))
+
+    def verify(self, candidate: Union[str, bytes], target_hash: str) -> bool:
+        if not HAVE_BCRYPT:
+            raise RuntimeError("bcrypt support requires: pip install bcrypt")
+        if isinstance(candidate, str):
+            candidate = candidate.encode('utf-8')
+        return bcrypt.checkpw(candidate, target_hash.encode('ascii'))
+
+
+class PBKDF2Hash(HashAlgorithm):
+    """PBKDF2-HMAC — verification only.
+
+    Expects targets in the ``pbkdf2_<digest>$<iterations>$<salt_b64>$<hash_b64>``
+    format.
+    """
+
+    name = 'pbkdf2'
+    hash_length = 0
+    supports_batch = False
+
+    def digest(self, data: bytes) -> bytes:
+        raise NotImplementedError("PBKDF2 is salted; use verify() instead")
+
+    def prepare_target(self, target_hash: str):
+        return self.normalize_hash(target_hash)
+
+    def verify_prepared(self, candidate, prepared) -> bool:
+        return self.verify(candidate, prepared)
+
+    def hash_password(self, password: Union[str, bytes],
+                      salt: bytes = b'', iterations: int = 260000,
+                      digest_name: str = 'sha256') -> str:
+        if isinstance(password, str):
+            password = password.encode('utf-8')
+        derived = hashlib.pbkdf2_hmac(digest_name, password, salt, iterations)
+        return 'pbkdf2_{}${}${}${}'.format(
+            digest_name, iterations,
+            base64.b64encode(salt).decode('ascii'),
+            base64.b64encode(derived).decode('ascii'))
+
+    def normalize_hash(self, hash_value: str) -> str:
+        return hash_value.strip()
+
+    def validate_hash(self, hash_value: str) -> bool:
+        parts = hash_value.strip().split('$')
+        return len(parts) == 4 and parts[0].startswith('pbkdf2_')
+
+    def verify(self, candidate: Union[str, bytes], target_hash: str) -> bool:
+        if isinstance(candidate, str):
+            candidate = candidate.encode('utf-8')
+        try:
+            scheme, iterations, salt_b64, hash_b64 = target_hash.strip().split('$')
+            digest_name = scheme.split('_', 1)[1]
+            salt = base64.b64decode(salt_b64)
+            expected = base64.b64decode(hash_b64)
+            iterations = int(iterations)
+        except (ValueError, IndexError):
+            return False
+        derived = hashlib.pbkdf2_hmac(digest_name, candidate, salt, iterations,
+                                      dklen=len(expected))
+        return hmac.compare_digest(derived, expected)
@@ -0,0 +1,156 @@
+"""Fast unsalted hash algorithms backed by hashlib."""
+
+import functools
+import hashlib
+from typing import Any, List
+
+from . import _md4, _sha_ni, _simd_md5
+from .base import HashAlgorithm
+
+# Looking an algorithm up by name (hashlib.new) walks the OpenSSL
+# provider registry per call; copying a prebuilt context skips that, so
+# the per-candidate cost is one copy plus one update.
+try:
+    _MD4_BASE = hashlib.new('md4')
+    _HAVE_OPENSSL_MD4 = True
+except ValueError:
+    _MD4_BASE = None
+    _HAVE_OPENSSL_MD4 = False
+
+# ``usedforsecurity=False`` skips the FIPS-compliance wrapper on OpenSSL
+# builds that have one — measurable when the constructor runs once per
+# 8-byte candidate.  Probed once here; partials keep the per-call path
+# in C without a kwargs unpack per digest.
+try:
+    hashlib.md5(b'', usedforsecurity=False)
+    _fast = functools.partial
+    _md5 = _fast(hashlib.md5, usedforsecurity=False)
+    _sha1 = _fast(hashlib.sha1, usedforsecurity=False)
+    _sha256 = _fast(hashlib.sha256, usedforsecurity=False)
+    _sha512 = _fast(hashlib.sha512, usedforsecurity=False)
+except (TypeError, ValueError):
+    _md5 = hashlib.md5
+    _sha1 = hashlib.sha1
+    _sha256 = hashlib.sha256
+    _sha512 = hashlib.sha512
+
+
+class MD5Hash(HashAlgorithm):
+    """MD5 — cryptographically broken, kept for legacy audits."""
+
+    name = 'md5'
+    hash_length = 32
+
+    def digest(self, data: bytes) -> bytes:
+        return _md5(data).digest()
+
+    def verify_batch(self, batch: List[bytes], target_digest: bytes) -> int:
+        """8-lane SIMD batch verify when the AVX2 kernel is built.
+
+        A single MD5 stream leaves most of a modern core's ALU idle;
+        eight independent streams interleaved across SIMD lanes keep it
+        busy, so groups of eight candidates are digested per C call and
+        the sixteen-byte results compared here.  Candidates longer than
+        one padded block (over 55 bytes — rare for password material)
+        and the tail shorter than a full group take the scalar path.
+        """
+        if not _simd_md5.HAVE_SIMD:
+            return super().verify_batch(batch, target_digest)
+        match = _simd_md5.md5_x8_match
+        max_len = _simd_md5.MAX_MESSAGE_LEN
+        target = target_digest
+        n = len(batch)
+        base = 0
+        while base + 8 <= n:
+            group = batch[base:base + 8]
+            if any(len(c) > max_len for c in group):
+                hit = super().verify_batch(group, target)
+            else:
+                hit = match(group, target)
+            if hit >= 0:
+                return base + hit
+            base += 8
+        if base < n:
+            hit = super().verify_batch(batch[base:], target)
+            if hit >= 0:
+                return base + hit
+        return -1
+
+
+def _verify_batch_sha_ni(algo: HashAlgorithm, batch: List[bytes],
+                         target: bytes, digests: Any,
+                         digest_size: int) -> int:
+    """Shared SHA-NI batch verify for SHA-1 and SHA-256.
+
+    The whole batch is padded and digested in one C call; candidates
+    longer than a single padded block (over 55 bytes) force the group
+    onto the scalar hashlib path.
+    """
+    max_len = _sha_ni.MAX_MESSAGE_LEN
+    if any(len(c) > max_len for c in batch):
+        return HashAlgorithm.verify_batch(algo, batch, target)
+    out = digests(batch)
+    if target in out:
+        for i in range(len(batch)):
+            if out[digest_size * i:digest_size * (i + 1)] == target:
+                return i
+    return -1
+
+
+class SHA1Hash(HashAlgorithm):
+    """SHA-1 — cryptographically broken, kept for legacy audits."""
+
+    name = 'sha1'
+    hash_length = 40
+
+    def digest(self, data: bytes) -> bytes:
+        return _sha1(data).digest()
+
+    def verify_batch(self, batch: List[bytes], target_digest: bytes) -> int:
+        """SHA-NI batch verify when the kernel is built and the CPU has it."""
+        if not _sha_ni.HAVE_SHA_NI:
+            return super().verify_batch(batch, target_digest)
+        return _verify_batch_sha_ni(self, batch, target_digest,
+                                    _sha_ni.sha1_digests, 20)
+
+
+class SHA256Hash(HashAlgorithm):
+    """SHA-256."""
+
+    name = 'sha256'
+    hash_length = 64
+
+    def digest(self, data: bytes) -> bytes:
+        return _sha256(data).digest()
+
+    def verify_batch(self, batch: List[bytes], target_digest: bytes) -> int:
+        """SHA-NI batch verify when the kernel is built and the CPU has it."""
+        if not _sha_ni.HAVE_SHA_NI:
+            return super().verify_batch(batch, target_digest)
+        return _verify_batch_sha_ni(self, batch, target_digest,
+                                    _sha_ni.sha256_digests, 32)
+
+
+class SHA512Hash(HashAlgorithm):
+    """SHA-512."""
+
+    name = 'sha512'
+    hash_length = 128
+
+    def digest(self, data: bytes) -> bytes:
+        return _sha512(data).digest()
+
+
+class NTLMHash(HashAlgorithm):
+    """NTLM (MD4 over the UTF-16LE password)."""
+
+    name = 'ntlm'
+    hash_length = 32
+
+    def digest(self, data: bytes) -> bytes:
+        utf16 = data.decode('utf-8', errors='ignore').encode('utf-16le')
+        if _HAVE_OPENSSL_MD4:
+            ctx = _MD4_BASE.copy()
+            ctx.update(utf16)
+            return ctx.digest()
+        return _md4.md4(utf16)
@@ -0,0 +1,7 @@
+"""Bulk I/O helpers."""
+
+from .block_reader import (LARGE_FILE_THRESHOLD, iter_lines,
+                           sequential_file, use_block_reader)
+
+__all__ = ['LARGE_FILE_THRESHOLD', 'iter_lines', 'sequential_file',
+           'use_block_reader']
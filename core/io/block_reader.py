@@ -0,0 +1,122 @@
+"""Large-block sequential line reader for big wordlists.
+
+Python's default line iteration reads through a small stdio buffer and
+pays one readline call per line.  For multi-GB wordlists this module
+instead pulls unbuffered 16 MB blocks and splits them with one C-level
+``bytes.split`` per block, carrying the partial last line between
+blocks — the read syscall and split cost amortize over ~2M lines per
+block.  The generator shape (lines out, block size in) is also the seam
+where an io_uring/O_DIRECT backend can be slotted for cold-cache NVMe
+without touching callers.
+
+Small files stay on the plain buffered path: block machinery only wins
+once the file is large enough to be read-bound, hence the 64 MB gate.
+"""
+
+import contextlib
+import os
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+    HAVE_NUMPY = False
+
+#: Bytes fetched per read call.
+BLOCK_SIZE = 16 * 1024 * 1024
+
+#: Below this file size the plain buffered reader is used.
+LARGE_FILE_THRESHOLD = 64 * 1024 * 1024
+
+
+def use_block_reader(path: str) -> bool:
+    """Whether ``path`` is large enough for block reads to pay off."""
+    try:
+        return os.path.getsize(path) > LARGE_FILE_THRESHOLD
+    except OSError:
+        return False
+
+
+_HAVE_FADVISE = hasattr(os, 'posix_fadvise')
+
+
+def _advise(fd: int, advice: int) -> None:
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+@contextlib.contextmanager
+def sequential_file(path: str, buffering: int = -1):
+    """Open ``path`` for a single sequential scan with kernel hints.
+
+    ``POSIX_FADV_SEQUENTIAL`` doubles readahead for the scan and
+    ``POSIX_FADV_DONTNEED`` on exit drops the pages promptly — a
+    wordlist is rarely re-read within the same run, so there is no
+    point letting it squat in the page cache.  No-ops where
+    ``posix_fadvise`` is unavailable.
+    """
+    f = open(path, 'rb', buffering=buffering)
+    try:
+        if _HAVE_FADVISE:
+            fd = f.fileno()
+            _advise(fd, os.POSIX_FADV_SEQUENTIAL)
+            _advise(fd, os.POSIX_FADV_WILLNEED)
+        yield f
+    finally:
+        # Generator finalization can land here after the file is
+        # already closed (an abandoned iter_lines chain dropped on an
+        # early hit); fileno() on a closed file raises ValueError.
+        if _HAVE_FADVISE and not f.closed:
+            _advise(f.fileno(), os.POSIX_FADV_DONTNEED)
+        f.close()
+
+
+def iter_lines(path: str, block_size: int = BLOCK_SIZE):
+    """Yield lines of ``path`` (newline stripped) from large block reads.
+
+    With numpy installed, newline offsets for a whole block come from
+    one vectorized byte scan and each line is a single slice; otherwise
+    ``bytes.split`` does the block in one C call.  Both carry the
+    partial last line between blocks.
+    """
+    with sequential_file(path, buffering=0) as f:
+        if HAVE_NUMPY:
+            yield from _iter_lines_vectorized(f, block_size)
+            return
+        read = f.read
+        tail = b''
+        while True:
+            block = read(block_size)
+            if not block:
+                break
+            if tail:
+                block = tail + block
+            lines = block.split(b'\n')
+            tail = lines.pop()
+            yield from lines
+        if tail:
+            yield tail
+
+
+def _iter_lines_vectorized(f, block_size: int):
+    """numpy path: newline offsets via one SIMD scan per block."""
+    read = f.read
+    newline = ord('\n')
+    tail = b''
+    while True:
+        block = read(block_size)
+        if not block:
+            break
+        if tail:
+            block = tail + block
+        offsets = np.flatnonzero(np.frombuffer(block, np.uint8) == newline)
+        start = 0
+        for end in offsets.tolist():
+            yield block[start:end]
+            start = end + 1
+        tail = block[start:]
+    if tail:
+        yield tail
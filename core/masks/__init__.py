@@ -0,0 +1,7 @@
+"""Mask parsing, analysis and expansion."""
+
+from .mask_expander import MaskExpander
+from .mask_generator import MaskGenerator
+from .mask_parser import MaskParser
+
+__all__ = ['MaskExpander', 'MaskGenerator', 'MaskParser']
@@ -0,0 +1,58 @@
+"""Optional Numba-accelerated kernel for bulk password-to-mask conversion.
+
+Converting millions of cracked passwords to masks is bounded by Python
+object churn even on the ``str.translate`` path — one str per password.
+When ``numba``/``numpy`` are installed, the kernel below categorizes a
+whole corpus in one pass over a contiguous byte buffer (passwords
+joined by newlines), emitting the mask bytes directly.  The range
+comparisons compile to branch-light native code LLVM can vectorize.
+The JIT is warmed once at import so first-call compilation cost is not
+paid on the hot path.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised when numba is absent
+    np = None
+    njit = None
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+
+    @njit(cache=True, boundscheck=False)
+    def batch_categorize(buf, token_table, out):
+        """Rewrite password bytes in ``buf`` as mask bytes in ``out``.
+
+        ``token_table`` maps each byte value to the second byte of its
+        placeholder token (``l``/``u``/``d``/``s``) or 0 for a literal.
+        Literals — including the newline separators between passwords —
+        pass through unchanged, so the output splits on the same
+        separator.  ``out`` must hold ``2 * len(buf)`` bytes (worst
+        case: every byte becomes a two-byte token); returns the number
+        of bytes written.
+        """
+        n = 0
+        for i in range(buf.shape[0]):
+            c = buf[i]
+            t = token_table[c]
+            if t:
+                out[n] = 0x3F  # '?'
+                out[n + 1] = t
+                n += 2
+            else:
+                out[n] = c
+                n += 1
+        return n
+
+    def _warm() -> None:
+        """Trigger JIT compilation once at import time."""
+        buf = np.frombuffer(b'a', dtype=np.uint8)
+        table = np.zeros(256, dtype=np.uint8)
+        batch_categorize(buf, table, np.empty(2, dtype=np.uint8))
+
+    _warm()
+
+else:
+    batch_categorize = None
@@ -0,0 +1,154 @@
+"""Mask expansion into candidate blocks."""
+
+import functools
+import math
+from typing import Any, Dict, Iterator, List, Sequence
+
+from ..attacks import _brute_kernels
+from ..attacks.brute_force import BruteForceAttack, _parse_mask
+
+
+@functools.lru_cache(maxsize=256)
+def _analyze_mask(mask: str) -> Dict[str, Any]:
+    """Keyspace metrics for a mask, computed once per distinct mask.
+
+    The log2 terms are summed at analysis time, so ranking M masks costs
+    one parse plus one fsum each — repeated queries (per-mask sort keys,
+    UI refreshes) hit the cache.
+    """
+    charsets, length = _parse_mask(mask)
+    sizes = list(map(len, charsets))
+    return {
+        'mask': mask,
+        'length': length,
+        'total_combinations': math.prod(sizes),
+        'entropy_bits': math.fsum(map(math.log2, sizes)),
+    }
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+    HAVE_NUMPY = False
+
+
+class MaskExpander:
+    """Expands a mask into candidate blocks.
+
+    With numpy installed, a whole block of candidates is produced by
+    mixed-radix arithmetic on an index vector — one gather per mask
+    position — and lands as a single contiguous byte buffer of
+    fixed-length rows, so consumers slice candidates out without any
+    per-candidate tuple or join.  Without numpy the same blocks are
+    assembled by the mixed-radix counter from
+    :meth:`BruteForceAttack._iter_mask_range`.
+    """
+
+    #: Candidates per generated block.
+    BLOCK_SIZE = 65536
+
+    def __init__(self, mask: str) -> None:
+        self.mask = mask
+        charsets, length = _parse_mask(mask)
+        self.charsets: List[bytes] = list(charsets)
+        self.length = length
+        self.total_combinations = math.prod(map(len, self.charsets))
+        if _brute_kernels.HAVE_NUMBA:
+            knp = _brute_kernels.np
+            self._flat = knp.frombuffer(b''.join(self.charsets),
+                                        dtype=knp.uint8)
+            koffsets = knp.zeros(length, dtype=knp.int64)
+            for p in range(1, length):
+                koffsets[p] = koffsets[p - 1] + len(self.charsets[p - 1])
+            self._offsets = koffsets
+            self._kernel_radixes = knp.array([len(cs) for cs in self.charsets],
+                                             dtype=knp.int64)
+        if HAVE_NUMPY:
+            self._radixes = np.array([len(cs) for cs in self.charsets],
+                                     dtype=np.int64)
+            # stride[p] = product of radixes right of p: digit p of index
+            # i is (i // stride[p]) % radix[p].
+            strides = [1] * length
+            for p in range(length - 2, -1, -1):
+                strides[p] = strides[p + 1] * len(self.charsets[p + 1])
+            self._strides = np.array(strides, dtype=np.int64)
+            self._char_arrays = [np.frombuffer(cs, dtype=np.uint8)
+                                 for cs in self.charsets]
+
+    def generate_blocks(self, block_size: int = BLOCK_SIZE,
+                        start: int = 0,
+                        end: int = None) -> Iterator[bytes]:
+        """Yield contiguous buffers of ``block_size`` fixed-length rows.
+
+        Each buffer holds up to ``block_size`` candidates back to back
+        (row length :attr:`length`); slice with
+        ``buf[i * length:(i + 1) * length]``.
+        """
+        if end is None:
+            end = self.total_combinations
+        if _brute_kernels.HAVE_NUMBA:
+            yield from self._generate_blocks_jit(block_size, start, end)
+            return
+        if HAVE_NUMPY:
+            yield from self._generate_blocks_vectorized(block_size, start, end)
+            return
+        row = 0
+        buf = bytearray()
+        for candidate in BruteForceAttack._iter_mask_range(self.charsets,
+                                                           start, end):
+            buf += candidate
+            row += 1
+            if row == block_size:
+                yield bytes(buf)
+                buf.clear()
+                row = 0
+        if buf:
+            yield bytes(buf)
+
+    def _generate_blocks_jit(self, block_size: int, start: int,
+                             end: int) -> Iterator[bytes]:
+        """Numba path: each index decoded independently across cores."""
+        knp = _brute_kernels.np
+        decode_range = _brute_kernels.decode_range
+        length = self.length
+        out = knp.empty(block_size * length, dtype=knp.uint8)
+        while start < end:
+            count = min(block_size, end - start)
+            decode_range(start, count, self._flat, self._offsets,
+                         self._kernel_radixes, length, out)
+            yield out[:count * length].tobytes()
+            start += count
+
+    def _generate_blocks_vectorized(self, block_size: int, start: int,
+                                    end: int) -> Iterator[bytes]:
+        """numpy path: one gather per position per block."""
+        length = self.length
+        char_arrays = self._char_arrays
+        strides = self._strides
+        radixes = self._radixes
+        while start < end:
+            stop = min(start + block_size, end)
+            idx = np.arange(start, stop, dtype=np.int64)
+            out = np.empty((idx.shape[0], length), dtype=np.uint8)
+            for p in range(length):
+                out[:, p] = char_arrays[p][(idx // strides[p]) % radixes[p]]
+            yield out.tobytes()
+            start = stop
+
+    def generate_combinations(self) -> Iterator[bytes]:
+        """Yield every candidate of the mask as ``bytes``."""
+        length = self.length
+        for block in self.generate_blocks():
+            for offset in range(0, len(block), length):
+                yield block[offset:offset + length]
+
+    def analyze_mask_complexity(self) -> Dict[str, Any]:
+        """Describe the keyspace this mask expands to."""
+        return dict(_analyze_mask(self.mask))
+
+    @staticmethod
+    def optimize_mask_order(masks: Sequence[str]) -> List[str]:
+        """Order masks cheapest-first so quick wins are tried early."""
+        return sorted(masks,
+                      key=lambda m: _analyze_mask(m)['total_combinations'])
@@ -0,0 +1,255 @@
+"""Mask generation from cracked corpora and target intelligence."""
+
+import functools
+import heapq
+import math
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import _mask_kernels
+from .mask_parser import _CHARACTER_SETS, MaskParser
+
+#: Translate table over the built-in character classes, at module level
+#: so pool workers can mask chunks without shipping a generator over.
+_DEFAULT_XLATE: Dict[int, str] = {}
+for _token in ('?l', '?u', '?d', '?s'):
+    for _char in _CHARACTER_SETS[_token]:
+        _DEFAULT_XLATE[ord(_char)] = _token
+del _token, _char
+
+#: Corpus size below which the process pool costs more than it saves.
+_PARALLEL_MIN = 50_000
+
+
+def _count_chunk(passwords: List[str]) -> Counter:
+    """Pool worker: tally the masks of one password chunk.
+
+    Masks are interned in the worker so its Counter keys by pointer;
+    the merged keys re-intern on the parent side via the serial path's
+    convention.
+    """
+    return Counter(filter(None, (sys.intern(password.translate(_DEFAULT_XLATE))
+                                 for password in passwords)))
+
+
+@functools.lru_cache(maxsize=16)
+def _placeholder_bits(placeholders: 'tuple[str, ...]') -> Dict[str, int]:
+    """One bit per known placeholder, for branchless diversity counts."""
+    return {placeholder: 1 << i
+            for i, placeholder in enumerate(placeholders)}
+
+
+@functools.lru_cache(maxsize=16)
+def _valid_mask_re(placeholder_chars: str) -> 're.Pattern[str]':
+    """Fullmatch pattern for syntactically valid non-empty masks.
+
+    Compiled per set of known placeholder letters so custom charsets
+    registered on the parser stay rankable.
+    """
+    return re.compile(r'(?:\?[%s]|[^?])+' % re.escape(placeholder_chars))
+
+
+class MaskGenerator:
+    """Derives candidate masks from known passwords and target details."""
+
+    #: Suffixes people actually append to names and words.
+    NAME_SUFFIXES = ('', '1', '123', '2023', '2024', '2025', '!')
+
+    def __init__(self) -> None:
+        self.parser = MaskParser()
+        # One translation table maps each ASCII codepoint straight to
+        # its mask token, so converting a password to its mask is a
+        # single C-level str.translate pass — no per-character Python
+        # branching.  Unmapped (non-ASCII) characters pass through as
+        # literals, which is also what the parser expects of them.
+        xlate: Dict[int, str] = {}
+        for char in self.parser.CHARACTER_SETS['?l']:
+            xlate[ord(char)] = '?l'
+        for char in self.parser.CHARACTER_SETS['?u']:
+            xlate[ord(char)] = '?u'
+        for char in self.parser.CHARACTER_SETS['?d']:
+            xlate[ord(char)] = '?d'
+        for char in self.parser.CHARACTER_SETS['?s']:
+            xlate[ord(char)] = '?s'
+        self._xlate = xlate
+        if _mask_kernels.HAVE_NUMBA:
+            # Byte-level version of the same table for the bulk numba
+            # kernel: byte value -> second token byte, 0 for literal.
+            table = _mask_kernels.np.zeros(256, dtype=_mask_kernels.np.uint8)
+            for codepoint, token in xlate.items():
+                table[codepoint] = ord(token[1])
+            self._token_table = table
+        else:
+            self._token_table = None
+        # Masks compose positionally: mask(name + suffix) is
+        # mask(name) + mask(suffix), so the suffix masks are fixed.
+        self._suffix_masks = tuple(self._password_to_mask(suffix)
+                                   for suffix in self.NAME_SUFFIXES)
+
+    def _password_to_mask(self, password: str) -> str:
+        """Convert a password to its mask, e.g. ``Pass12`` → ``?u?l?l?l?d?d``.
+
+        The result is interned: mask cardinality is tiny next to corpus
+        size, so Counter and cache keys compare by pointer and a
+        million-entry tally holds one string per distinct mask.
+        """
+        return sys.intern(password.translate(self._xlate))
+
+    def generate_masks_from_passwords(self, passwords: Iterable[str],
+                                      top_k: Optional[int] = None
+                                      ) -> List[str]:
+        """Distill a cracked-password corpus into masks, most common first.
+
+        The tally is a ``Counter`` fed by a generator, so counting runs
+        in C (one increment per password) instead of a Python-level
+        hash-get-store round-trip each.  With ``top_k`` set, only the K
+        most frequent masks come back — a heap selection, O(N log K)
+        rather than a full O(N log N) sort; ordering is only guaranteed
+        among the returned elements.
+        """
+        counts = Counter(filter(None, map(self._password_to_mask, passwords)))
+        return [mask for mask, _ in counts.most_common(top_k)]
+
+    def generate_masks_from_passwords_fast(self, passwords: Iterable[str],
+                                           top_k: Optional[int] = None
+                                           ) -> List[str]:
+        """Bulk variant of :meth:`generate_masks_from_passwords`.
+
+        Joins the corpus into one newline-separated byte buffer and
+        categorizes it with a single native-code pass when numba is
+        available; falls back to the per-password translate path
+        otherwise.  Same result, most common first.
+        """
+        if not _mask_kernels.HAVE_NUMBA:
+            return self.generate_masks_from_passwords(passwords, top_k)
+        np = _mask_kernels.np
+        blob = '\n'.join(passwords).encode('utf-8')
+        if not blob:
+            return []
+        buf = np.frombuffer(blob, dtype=np.uint8)
+        out = np.empty(2 * len(blob), dtype=np.uint8)
+        written = _mask_kernels.batch_categorize(buf, self._token_table, out)
+        masks = map(sys.intern,
+                    out[:written].tobytes().decode('utf-8').split('\n'))
+        counts = Counter(filter(None, masks))
+        return [mask for mask, _ in counts.most_common(top_k)]
+
+    def generate_masks_from_passwords_parallel(
+            self, passwords: Iterable[str],
+            top_k: Optional[int] = None) -> List[str]:
+        """Map-reduce variant for multi-million password corpora.
+
+        Chunks the corpus across a process pool, tallies per-chunk
+        Counters in the workers and merges them here.  Small corpora
+        fall through to the serial path, where pool startup would cost
+        more than it saves.  Ordering among equal-frequency masks may
+        differ run to run.
+        """
+        passwords = (passwords if isinstance(passwords, list)
+                     else list(passwords))
+        if len(passwords) < _PARALLEL_MIN:
+            return self.generate_masks_from_passwords(passwords, top_k)
+        workers = os.cpu_count() or 1
+        chunk_size = max(10_000, len(passwords) // (workers * 4))
+        chunks = [passwords[i:i + chunk_size]
+                  for i in range(0, len(passwords), chunk_size)]
+        counts: Counter = Counter()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for partial in pool.map(_count_chunk, chunks):
+                counts += partial
+        return [mask for mask, _ in counts.most_common(top_k)]
+
+    def rank_masks_by_effectiveness(
+            self, masks: Iterable[str],
+            cracked_passwords: Optional[Iterable[str]] = None,
+            top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Score masks by expected yield per unit of keyspace.
+
+        The heuristic favors short masks with diverse character classes
+        (real-password shapes) and penalizes keyspace size; masks that
+        match passwords in ``cracked_passwords`` get a strong boost.
+        With ``top_k`` set, only the K best come back via a heap
+        selection — O(N log K) instead of sorting every entry.
+        """
+        # Tally the corpus once up front: each mask then looks up its
+        # match count instead of re-masking every password per mask.
+        cracked_counts = Counter(map(self._password_to_mask,
+                                     cracked_passwords or ()))
+        valid_re = _valid_mask_re(
+            ''.join(sorted(ph[1] for ph in self.parser.CHARACTER_SETS)))
+        ph_bit = _placeholder_bits(tuple(self.parser.CHARACTER_SETS))
+        ranked: List[Dict[str, Any]] = []
+        for mask in masks:
+            # Cheap regex prefilter: invalid masks never reach the
+            # parser, so the hot path pays no exception unwinds.
+            if not valid_re.fullmatch(mask):
+                ranked.append({'mask': mask, 'score': -100.0,
+                               'length': 0, 'keyspace': 0})
+                continue
+            parsed = self.parser.parse_mask(mask)
+            # Distinct-class count as a popcount: one OR per component
+            # instead of building and hashing into a throwaway set.
+            bits = 0
+            for component in parsed['components']:
+                bits |= ph_bit.get(component['value'], 0)
+            keyspace = parsed['total_combinations']
+            score = bits.bit_count() * 2.0
+            score -= parsed['length'] * 0.5
+            if keyspace > 1:
+                score -= math.log10(keyspace)
+            score += cracked_counts.get(mask, 0) * 10.0
+            ranked.append({'mask': mask, 'score': score,
+                           'length': parsed['length'], 'keyspace': keyspace})
+        if top_k is not None:
+            return heapq.nlargest(top_k, ranked, key=itemgetter('score'))
+        ranked.sort(key=itemgetter('score'), reverse=True)
+        return ranked
+
+    def _generate_name_masks(self, names: Iterable[str]) -> List[str]:
+        """Masks covering a name with the usual decorations.
+
+        Each name is masked once and composed with the precomputed
+        suffix masks, rather than re-masking every concatenation.
+        """
+        name_masks: List[str] = []
+        for name in names:
+            base = self._password_to_mask(name)
+            if base:
+                name_masks.extend(base + suffix_mask
+                                  for suffix_mask in self._suffix_masks)
+        return name_masks
+
+    def generate_targeted_masks(self,
+                                target_info: Dict[str, Any]) -> List[str]:
+        """Masks built from what is known about the target.
+
+        ``target_info`` may carry ``names``, ``keywords`` and
+        ``birth_years`` lists; each contributes shapes a targeted run
+        should try before any systematic sweep.  The result keeps
+        first-seen order (names, then keywords, then year combos), so
+        callers can run it front-to-back as a priority list.
+        """
+        masks: List[str] = []
+        names = target_info.get('names', [])
+        masks.extend(self._generate_name_masks(names))
+        for keyword in target_info.get('keywords', []):
+            base = self._password_to_mask(keyword)
+            if not base:
+                continue
+            masks.append(base)
+            masks.append(base + '?d?d')
+            masks.append(base + '?d?d?d?d')
+            masks.append(base + '?s')
+        for year in target_info.get('birth_years', []):
+            year_mask = self._password_to_mask(str(year))
+            for name in names:
+                base = self._password_to_mask(name)
+                if base:
+                    masks.append(base + year_mask)
+        return list(dict.fromkeys(masks))
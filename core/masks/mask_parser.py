@@ -0,0 +1,360 @@
+"""Mask parsing and analysis for attack planning.
+
+Unlike :mod:`..attacks.brute_force`, which parses masks into the bytes
+character sets the enumeration hot path needs, this module works on the
+analysis side: validating user-supplied masks, describing their
+components, estimating crack times, and suggesting masks worth running.
+"""
+
+import functools
+import math
+import re
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
+
+#: One pass over the mask yields every token: a ``?``-placeholder pair
+#: or a single literal.  A trailing lone ``?`` surfaces as a 1-char
+#: token, which the parser rejects as dangling.
+_TOKEN_RE = re.compile(r'\?.|.', re.DOTALL)
+
+#: Built-in character sets, module-level so the class attributes can be
+#: immutable proxy views; parsers get mutable per-instance copies.
+_CHARACTER_SETS = {
+    '?l': 'abcdefghijklmnopqrstuvwxyz',
+    '?u': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    '?d': '0123456789',
+    '?s': '!@#$%^&*()-_=+[]{}|;:\'",.<>/?`~',
+    '?a': ('abcdefghijklmnopqrstuvwxyz'
+           'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+           '0123456789'
+           '!@#$%^&*()-_=+[]{}|;:\'",.<>/?`~'),
+    '?b': '01',
+    '?h': '0123456789abcdef',
+    '?H': '0123456789ABCDEF',
+}
+
+_MASK_PLACEHOLDERS = {
+    '?l': 'lowercase letters',
+    '?u': 'uppercase letters',
+    '?d': 'digits',
+    '?s': 'symbols',
+    '?a': 'all printable characters',
+    '?b': 'binary digits',
+    '?h': 'lowercase hex digits',
+    '?H': 'uppercase hex digits',
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _invalid_placeholder_re(placeholder_chars: str) -> 're.Pattern[str]':
+    """Pattern matching every ill-formed ``?`` in a mask.
+
+    A ``?`` not followed by a known placeholder letter — including a
+    trailing ``?`` with nothing after it — is a match.  Compiled per
+    set of placeholder letters so custom charsets validate too.
+    """
+    return re.compile(r'\?(?![%s])' % re.escape(placeholder_chars))
+
+
+@functools.lru_cache(maxsize=64)
+def _component_singletons(charset_items: Tuple[Tuple[str, str], ...]
+                          ) -> Dict[str, Mapping[str, Any]]:
+    """One frozen component per placeholder, shared across all parses.
+
+    Every ``?l`` in every mask is the same component; allocating a
+    fresh dict per occurrence is pure garbage.  The proxies are
+    immutable, which also enforces the read-only contract on the
+    shared components list.
+    """
+    return {
+        placeholder: MappingProxyType({
+            'type': 'placeholder',
+            'value': placeholder,
+            'character_set': charset,
+            'size': len(charset),
+        })
+        for placeholder, charset in charset_items
+    }
+
+
+@functools.lru_cache(maxsize=512)
+def _literal_component(char: str) -> Mapping[str, Any]:
+    """Shared frozen component for one literal character."""
+    return MappingProxyType({
+        'type': 'literal',
+        'value': char,
+        'character_set': char,
+        'size': 1,
+    })
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_combinations_cached(mask: str,
+                               charset_items: Tuple[Tuple[str, str], ...]
+                               ) -> int:
+    """Keyspace size of ``mask`` without materializing components.
+
+    Callers that only need the count — crack-time estimates, keyspace
+    warnings — skip the components list entirely; this is one token
+    scan multiplying plain ints.
+    """
+    charsets = dict(charset_items)
+    total = 1
+    for token in _TOKEN_RE.findall(mask):
+        if token[0] == '?':
+            if len(token) == 1:
+                raise ValueError("Dangling '?' at end of mask")
+            charset = charsets.get(token)
+            if charset is None:
+                raise ValueError(f"Unknown mask placeholder: {token}")
+            total *= len(charset)
+    return total
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_components_cached(mask: str,
+                             charset_items: Tuple[Tuple[str, str], ...]
+                             ) -> Tuple[Mapping[str, Any], ...]:
+    """Tokenize ``mask`` into its component tuple, memoized.
+
+    The same masks come back repeatedly from validation, ranking and
+    crack-time estimation, so the O(L) walk runs once per distinct
+    ``(mask, charsets)`` pair.  The tuple and its frozen components are
+    shared across callers.
+    """
+    singletons = _component_singletons(charset_items)
+    components: List[Mapping[str, Any]] = []
+    for token in _TOKEN_RE.findall(mask):
+        if token[0] == '?':
+            if len(token) == 1:
+                raise ValueError("Dangling '?' at end of mask")
+            component = singletons.get(token)
+            if component is None:
+                raise ValueError(f"Unknown mask placeholder: {token}")
+            components.append(component)
+        else:
+            components.append(_literal_component(token))
+    return tuple(components)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_mask_cached(mask: str,
+                       charset_items: Tuple[Tuple[str, str], ...]
+                       ) -> Dict[str, Any]:
+    """Full parse including the keyspace size, memoized.
+
+    The cached dict is shared — callers get a shallow copy from
+    :meth:`MaskParser.parse_mask` and must treat the components as
+    read-only.
+    """
+    components = _parse_components_cached(mask, charset_items)
+    # Interned: masks have tiny cardinality, so downstream dicts keyed
+    # on the parsed mask compare by pointer.
+    return {
+        'mask': sys.intern(mask),
+        'length': len(components),
+        'components': components,
+        'total_combinations': MaskParser._calculate_combinations(components),
+    }
+
+
+class MaskParser:
+    """Parses and analyzes hashcat-style mask strings."""
+
+    #: Frozen views of the built-in tables.  Reading through the class
+    #: can never mutate them (which would silently invalidate the parse
+    #: cache); instances shadow these with their own mutable copies.
+    CHARACTER_SETS: Mapping[str, str] = MappingProxyType(_CHARACTER_SETS)
+    MASK_PLACEHOLDERS: Mapping[str, str] = MappingProxyType(_MASK_PLACEHOLDERS)
+
+    #: Patterns that recur across real password corpora, cheapest first.
+    COMMON_PATTERNS = [
+        '?l?l?l?l?l?l',
+        '?l?l?l?l?l?l?l?l',
+        '?d?d?d?d?d?d',
+        '?d?d?d?d?d?d?d?d',
+        '?u?l?l?l?l?d?d',
+        '?u?l?l?l?l?l?d?d',
+        '?l?l?l?l?d?d?d?d',
+        '?u?l?l?l?l?l?d?d?s',
+        '?l?l?l?l?l?l?d?d',
+    ]
+
+    #: Keyspace size above which validate_mask warns the run is unrealistic.
+    KEYSPACE_WARNING_THRESHOLD = 10 ** 12
+
+    #: Single-class placeholders eligible for promotion to ``?a``.
+    _COALESCIBLE = ('?l', '?u', '?d', '?s')
+
+    def __init__(self) -> None:
+        # Instance copies so add_custom_charset never leaks between
+        # parsers configured differently.
+        self.CHARACTER_SETS = dict(_CHARACTER_SETS)
+        self.MASK_PLACEHOLDERS = dict(_MASK_PLACEHOLDERS)
+        # Hashable cache key for _parse_mask_cached; rebuilt whenever
+        # the charsets change so stale parses can never be served.
+        self._charset_key = tuple(sorted(self.CHARACTER_SETS.items()))
+        self._placeholder_chars = ''.join(
+            sorted(key[1] for key in self.CHARACTER_SETS))
+
+    def parse_mask(self, mask: str) -> Dict[str, Any]:
+        """Break a mask into components and size its keyspace.
+
+        Raises ``ValueError`` for dangling ``?`` or unknown placeholders.
+        Results are memoized per ``(mask, charsets)``; the returned dict
+        is the caller's, but its components list is shared and read-only.
+        """
+        return dict(_parse_mask_cached(mask, self._charset_key))
+
+    def parse_mask_fast(self, mask: str) -> Dict[str, Any]:
+        """Like :meth:`parse_mask` but without ``total_combinations``.
+
+        Long ``?a`` masks make the keyspace a multi-word bignum whose
+        chained multiplication is pure waste for callers that only need
+        the components or length; this path skips it entirely.  Use
+        :meth:`count_combinations` when only the size is needed.
+        """
+        components = _parse_components_cached(mask, self._charset_key)
+        return {
+            'mask': sys.intern(mask),
+            'length': len(components),
+            'components': components,
+        }
+
+    def count_combinations(self, mask: str) -> int:
+        """Keyspace size of ``mask``, without building its components."""
+        return _count_combinations_cached(mask, self._charset_key)
+
+    @staticmethod
+    def _calculate_combinations(
+            components: Tuple[Mapping[str, Any], ...]) -> int:
+        """Keyspace size: product of per-position character-set sizes."""
+        return math.prod(component['size'] for component in components)
+
+    def validate_mask(self, mask: str) -> Dict[str, Any]:
+        """Check a mask for syntax errors and impractical keyspaces.
+
+        One compiled-regex pass finds every ill-formed ``?`` directly,
+        replacing the old per-character scan.
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+        for match in _invalid_placeholder_re(
+                self._placeholder_chars).finditer(mask):
+            i = match.start()
+            if i + 1 >= len(mask):
+                errors.append(f"Dangling '?' at position {i}")
+            else:
+                errors.append(f"Unknown placeholder {mask[i:i + 2]!r} "
+                              f"at position {i}")
+        if not mask:
+            errors.append("Empty mask")
+        if not errors:
+            combinations = self.count_combinations(mask)
+            if combinations > self.KEYSPACE_WARNING_THRESHOLD:
+                warnings.append(
+                    f"Keyspace of {combinations:.2e} "
+                    "combinations is impractical on CPU")
+        return {'valid': not errors, 'errors': errors, 'warnings': warnings}
+
+    def estimate_crack_time(self, mask: str,
+                            hashes_per_second: int = 1_000_000_000
+                            ) -> Dict[str, Any]:
+        """Worst-case time to exhaust a mask at the given hash rate."""
+        total = self.count_combinations(mask)
+        seconds = total / hashes_per_second
+        if seconds < 60:
+            display = f'{seconds:.1f} seconds'
+        elif seconds < 3600:
+            display = f'{seconds / 60:.1f} minutes'
+        elif seconds < 86400:
+            display = f'{seconds / 3600:.1f} hours'
+        else:
+            display = f'{seconds / 86400:.1f} days'
+        return {
+            'mask': mask,
+            'total_combinations': total,
+            'seconds': seconds,
+            'display': display,
+        }
+
+    def generate_common_masks(self, min_length: int = 4,
+                              max_length: int = 10) -> List[str]:
+        """Masks worth trying first, bounded by length.
+
+        Returned in first-seen order — curated patterns before
+        systematic sweeps — deduplicated without disturbing that order.
+        """
+        masks = [m for m in self.COMMON_PATTERNS
+                 if min_length <= self.parse_mask(m)['length'] <= max_length]
+        masks.extend(self._generate_systematic_masks(min_length, max_length))
+        return self.coalesce_masks(list(dict.fromkeys(masks)))
+
+    def coalesce_masks(self, masks: List[str],
+                       threshold: int = 3) -> List[str]:
+        """Merge sibling masks that differ in one placeholder position.
+
+        When at least ``threshold`` masks share a shape and differ only
+        in a single-class placeholder at one position (``...?l`` vs
+        ``...?u`` vs ``...?d``), the group collapses to one ``?a`` mask.
+        Fewer masks means fewer per-job dispatches downstream, bought
+        with one slightly larger keyspace — a good trade on small masks.
+        Order is first-seen; a coalesced group appears at its first
+        member's position.
+        """
+        # Shape key: the token sequence with one coalescible position
+        # blanked out; each key collects the variants seen there.
+        groups: Dict[Tuple[int, Tuple[str, ...]], set] = {}
+        for mask in masks:
+            tokens = tuple(_TOKEN_RE.findall(mask))
+            for i, token in enumerate(tokens):
+                if token in self._COALESCIBLE:
+                    shape = (i, tokens[:i] + ('',) + tokens[i + 1:])
+                    groups.setdefault(shape, set()).add(token)
+        replacements: Dict[str, str] = {}
+        for (i, tokens), variants in groups.items():
+            if len(variants) >= threshold:
+                prefix = ''.join(tokens[:i])
+                suffix = ''.join(tokens[i + 1:])
+                generalized = prefix + '?a' + suffix
+                for token in variants:
+                    replacements[prefix + token + suffix] = generalized
+        return list(dict.fromkeys(
+            replacements.get(mask, mask) for mask in masks))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _generate_systematic_masks(min_length: int,
+                                   max_length: int) -> Tuple[str, ...]:
+        """Single-class masks plus a few standard mixed shapes.
+
+        Deterministic per length bound, so the tuple is memoized — the
+        string multiplications run once per distinct range.
+        """
+        lengths = range(min_length, max_length + 1)
+        mixed_lengths = range(max(min_length, 4), max_length + 1)
+        return (
+            tuple(char_type * length
+                  for char_type in ('?l', '?u', '?d', '?s')
+                  for length in lengths)
+            # Capitalized word + two digits.
+            + tuple('?u' + '?l' * (length - 3) + '?d?d'
+                    for length in mixed_lengths)
+            # Word + four digits.
+            + tuple('?l' * (length - 4) + '?d?d?d?d'
+                    for length in mixed_lengths if length >= 5)
+        )
+
+    def add_custom_charset(self, placeholder: str, charset: str,
+                           description: str = 'custom character set') -> None:
+        """Register a custom ``?x``-style placeholder on this parser."""
+        if (len(placeholder) != 2 or placeholder[0] != '?'
+                or not charset):
+            raise ValueError("Placeholder must look like '?x' with a "
+                             "non-empty character set")
+        self.CHARACTER_SETS[placeholder] = charset
+        self.MASK_PLACEHOLDERS[placeholder] = description
+        self._charset_key = tuple(sorted(self.CHARACTER_SETS.items()))
+        self._placeholder_chars = ''.join(
+            sorted(key[1] for key in self.CHARACTER_SETS))
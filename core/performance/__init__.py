@@ -0,0 +1,5 @@
+"""Benchmarking and run-parameter tuning."""
+
+from .optimizer import PerformanceOptimizer
+
+__all__ = ['PerformanceOptimizer']
@@ -0,0 +1,280 @@
+"""Performance measurement and tuning recommendations.
+
+Benchmarks the available hash algorithms on this host and turns the
+results, plus a system snapshot, into worker-count and chunk-size
+recommendations for the cracking engine.
+"""
+
+import functools
+import hashlib
+import math
+import multiprocessing as mp
+import ssl
+import statistics
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Sequence
+
+from ..utils import get_system_info
+
+#: The host does not change under us; probe it once per process.
+_cached_system_info = functools.lru_cache(maxsize=1)(get_system_info)
+
+#: Digests cheap enough to measure by buffer throughput.
+FAST_ALGORITHMS = ('md5', 'sha1', 'sha256', 'sha512')
+
+#: Benchmark buffer: ~1 MiB of newline-joined candidate-like data.
+_BENCH_BUFFER = b'password123\n' * 87382
+_BENCH_ROUNDS = 32
+
+#: Representative candidate length for hashes/sec estimates.
+_TYPICAL_CANDIDATE_BYTES = 9
+
+#: Clamp for adaptive chunk sizing: below 8 the queue round-trips
+#: dominate; above 50k a straggler chunk stalls the join.
+_CHUNK_MIN = 8
+_CHUNK_MAX = 50_000
+
+
+class PerformanceOptimizer:
+    """Benchmarks hashing on this host and recommends run parameters."""
+
+    #: Recommendation-history entries kept for reporting.
+    HISTORY_SIZE = 256
+
+    def __init__(self) -> None:
+        # Bounded: a long-running service requesting recommendations
+        # per job must not accrete history without limit.
+        self.optimization_history: Deque[Dict[str, Any]] = deque(
+            maxlen=self.HISTORY_SIZE)
+        #: Autotuned worker counts keyed by (algorithm name, cpu count).
+        self.algorithm_benchmarks: Dict[Any, int] = {}
+
+    @functools.cached_property
+    def system_info(self) -> Dict[str, Any]:
+        """Host snapshot, probed lazily and shared process-wide.
+
+        CLI entry points build an optimizer per invocation; callers
+        that only want a chunk-size heuristic should not pay for
+        platform probing at construction.
+        """
+        return _cached_system_info()
+
+    # -- benchmarking --------------------------------------------------
+
+    def benchmark_algorithms(
+            self,
+            algorithm_names: Sequence[str] = FAST_ALGORITHMS
+    ) -> Dict[str, Dict[str, Any]]:
+        """Measure digest throughput for each fast algorithm.
+
+        Hashes a ~1 MiB buffer repeatedly through one hash object so
+        the measurement sits in libcrypto's C (and, where the CPU has
+        them, SHA-NI/AVX) loops — hashing a handful of short strings
+        instead would time interpreter overhead and noise, and those
+        numbers steer worker and chunk decisions downstream.  Reports
+        bytes/sec plus a hashes/sec estimate at a typical candidate
+        length.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        buffer = _BENCH_BUFFER
+        for name in algorithm_names:
+            if name not in hashlib.algorithms_available:
+                continue
+            digest = hashlib.new(name)
+            digest.update(buffer)  # warm: first call pays setup
+            start = time.perf_counter_ns()
+            for _ in range(_BENCH_ROUNDS):
+                digest.update(buffer)
+            elapsed = time.perf_counter_ns() - start
+            bytes_per_second = (len(buffer) * _BENCH_ROUNDS
+                                * 1_000_000_000 / max(1, elapsed))
+            results[name] = {
+                'bytes_per_second': bytes_per_second,
+                'hashes_per_second': bytes_per_second
+                / _TYPICAL_CANDIDATE_BYTES,
+                'backend': ssl.OPENSSL_VERSION,
+            }
+        return results
+
+    @staticmethod
+    def benchmark_slow_algorithm(algorithm, password: str = 'benchmark',
+                                 iterations: int = 50) -> Dict[str, Any]:
+        """Per-password timing for deliberately slow hashes.
+
+        Buffer throughput is meaningless for bcrypt/PBKDF2 — their cost
+        is per invocation — so this times ``hash_password`` calls and
+        takes the median, which shrugs off scheduler blips that would
+        skew a mean of 5 samples.
+        """
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            algorithm.hash_password(password)
+            timings.append(time.perf_counter() - start)
+        median = statistics.median(timings)
+        return {
+            'seconds_per_hash': median,
+            'hashes_per_second': 1.0 / median if median else 0.0,
+            'iterations': iterations,
+        }
+
+    # -- tuning --------------------------------------------------------
+
+    def _autotune_workers(self, algorithm, sample_size: int = 2048) -> int:
+        """Measure, once per algorithm, how many workers actually help.
+
+        Static heuristics miss where an algorithm stops scaling —
+        bcrypt saturates well before the nominal core count while MD5
+        wants every core — so this times a small calibration batch
+        through pools of 1, 2, 4, ... workers and keeps the smallest
+        count whose throughput still improves meaningfully.  The
+        winner is cached per (algorithm, cpu count), so the sweep runs
+        once per process.
+        """
+        cpu_count = self.system_info['cpu_count']
+        key = (algorithm.name, cpu_count)
+        cached = self.algorithm_benchmarks.get(key)
+        if cached is not None:
+            return cached
+        sample = [f'benchmark{i}' for i in range(sample_size)]
+        candidates = []
+        n = 1
+        while n < cpu_count:
+            candidates.append(n)
+            n *= 2
+        candidates.append(cpu_count)
+        if 'fork' in mp.get_all_start_methods():
+            ctx = mp.get_context('fork')
+        else:
+            ctx = mp.get_context()
+        best_workers, best_rate = 1, 0.0
+        for workers in candidates:
+            with ctx.Pool(workers) as pool:
+                start = time.perf_counter()
+                pool.map(algorithm.hash_password, sample,
+                         chunksize=max(1, sample_size // (workers * 4)))
+                elapsed = time.perf_counter() - start
+            rate = sample_size / max(elapsed, 1e-9)
+            # The knee: more workers must buy a real gain, not noise.
+            if rate > best_rate * 1.10:
+                best_workers, best_rate = workers, rate
+        self.algorithm_benchmarks[key] = best_workers
+        return best_workers
+
+    def optimize_worker_count(self, algorithm_name: str = 'md5',
+                              algorithm=None) -> Dict[str, Any]:
+        """Recommend a worker count for this host and algorithm.
+
+        Given an algorithm instance, the count comes from the measured
+        :meth:`_autotune_workers` sweep; with only a name, the static
+        core-count heuristic stands in.
+        """
+        cpu_count = self.system_info['cpu_count']
+        if algorithm is not None:
+            optimal = self._autotune_workers(algorithm)
+            tuned = True
+        elif algorithm_name in ('bcrypt', 'pbkdf2'):
+            # Memory/latency bound per call; oversubscription only
+            # adds context switches.
+            optimal = cpu_count
+            tuned = False
+        else:
+            optimal = max(1, cpu_count - 1)
+            tuned = False
+        return {
+            'optimal_workers': optimal,
+            'cpu_count': cpu_count,
+            'algorithm': (algorithm.name if algorithm is not None
+                          else algorithm_name),
+            'autotuned': tuned,
+        }
+
+    def optimize_chunk_size(self, total_items: int,
+                            worker_count: Optional[int] = None
+                            ) -> Dict[str, Any]:
+        """Recommend a starting work-chunk size for ``total_items``.
+
+        The base is ``sqrt(total_items / workers)``, which balances
+        queue round-trip overhead against load imbalance far better
+        than a fixed ladder of coarse ranges — small keyspaces get
+        small chunks, huge ones grow only as the square root.  The
+        result is a starting point: the coordinator should refine it
+        through :meth:`update_chunk_from_feedback` as the run reveals
+        contention or starvation.
+        """
+        if worker_count is None:
+            worker_count = self.system_info['cpu_count']
+        chunk_size = max(1, int(math.sqrt(total_items
+                                          / max(1, worker_count))))
+        chunk_size = max(_CHUNK_MIN, min(_CHUNK_MAX, chunk_size))
+        chunk_size = min(chunk_size, max(1, total_items))
+        self._chunk_size = chunk_size
+        return {
+            'optimized_chunk_size': chunk_size,
+            'total_items': total_items,
+            'worker_count': worker_count,
+            'adaptive': True,
+        }
+
+    def update_chunk_from_feedback(self, steal_failures: int = 0,
+                                   queue_empties: int = 0) -> int:
+        """Adapt the chunk size to observed scheduler behavior.
+
+        Queue-empty events mean workers outran the producer — double
+        the chunk so each dispatch carries more work; steal failures
+        mean chunks are too coarse to rebalance — halve them.  The
+        dominant signal wins; the result stays clamped and becomes the
+        new current size.
+        """
+        chunk = getattr(self, '_chunk_size', _CHUNK_MIN)
+        if queue_empties > steal_failures:
+            chunk *= 2
+        elif steal_failures > queue_empties:
+            chunk //= 2
+        chunk = max(_CHUNK_MIN, min(_CHUNK_MAX, chunk))
+        self._chunk_size = chunk
+        return chunk
+
+    @functools.cached_property
+    def _system_score(self) -> float:
+        """Coarse capability score: cores weighted by memory headroom.
+
+        Depends only on the immutable system snapshot, so it is
+        computed once per optimizer.
+        """
+        info = self.system_info
+        memory_gb = info['total_memory_mb'] / 1024
+        return info['cpu_count'] * min(2.0, 0.5 + memory_gb / 8)
+
+    def get_optimization_recommendations(
+            self, total_items: int,
+            algorithm_name: str = 'md5') -> Dict[str, Any]:
+        """Bundle worker and chunk recommendations for one run."""
+        worker = self.optimize_worker_count(algorithm_name)
+        chunk = self.optimize_chunk_size(total_items,
+                                         worker['optimal_workers'])
+        recommendations = {
+            'worker_optimization': worker,
+            'chunk_optimization': chunk,
+            'system_score': self._system_score,
+        }
+        # Compact entry: just the decisions, not the nested dicts or a
+        # copy of the system snapshot per call.
+        self.optimization_history.append({
+            'timestamp': time.time(),
+            'algorithm': algorithm_name,
+            'total_items': total_items,
+            'worker_count': worker['optimal_workers'],
+            'chunk_size': chunk['optimized_chunk_size'],
+        })
+        return recommendations
+
+    def get_performance_report(self) -> Dict[str, Any]:
+        """Summarize the host and recent recommendation history."""
+        return {
+            'system_info': self.system_info,
+            'system_score': self._system_score,
+            'recent_optimizations': list(self.optimization_history),
+            'total_optimizations': len(self.optimization_history),
+        }
@@ -0,0 +1,6 @@
+"""Password-mutation rules and the engine that applies them."""
+
+from .common_rules import CommonPasswordRules
+from .engine import RuleEngine
+
+__all__ = ['CommonPasswordRules', 'RuleEngine']
@@ -0,0 +1,277 @@
+"""Common password-mutation rules for wordlist expansion.
+
+Where :mod:`..attacks.dictionary` applies a fixed bytes-level mutation
+set inline on its own hot path, this module is the reusable str-level
+rules library: composable per-word generators plus batch variants that
+expand a whole wordlist chunk at a time for the rule engine.
+"""
+
+import string
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+# Compiled Cython affix kernel (see _rules.pyx); optional, the
+# comprehension fallback in mutate_batch covers its absence.
+try:
+    from . import _rules as _crules
+except ImportError:
+    _crules = None
+
+
+class CommonPasswordRules:
+    """Standard mutations real users apply to base words."""
+
+    #: Leetspeak substitutions, most common replacement first.
+    LEET_MAP: Dict[str, Tuple[str, ...]] = {
+        'a': ('@', '4'),
+        'b': ('8',),
+        'e': ('3',),
+        'g': ('9',),
+        'i': ('1', '!'),
+        'l': ('1',),
+        'o': ('0',),
+        's': ('$', '5'),
+        't': ('7',),
+    }
+
+    COMMON_NUMBERS = ('1', '12', '123', '1234', '2023', '2024', '2025',
+                      '01', '69', '007', '99')
+    COMMON_SYMBOLS = ('!', '!!', '?', '@', '#', '$')
+    COMMON_PREFIXES = ('1', '123', '!', '@')
+    COMMON_SUFFIXES = ('1', '123', '!', '123!', '2024', '!!')
+
+    #: Full leetspeak substitution as one translate table, built once
+    #: at class load from each character's most common replacement.
+    _LEET_TRANS_PRIMARY = str.maketrans(
+        {char: replacements[0]
+         for char, replacements in LEET_MAP.items()})
+
+    #: The affix tables pre-encoded once at class load.  Hashers want
+    #: bytes; producing str candidates makes hashlib re-encode every
+    #: one, which is a measurable share of a fast digest like MD5.
+    _COMMON_NUMBERS_B = tuple(s.encode('ascii') for s in COMMON_NUMBERS)
+    _COMMON_SYMBOLS_B = tuple(s.encode('ascii') for s in COMMON_SYMBOLS)
+    _COMMON_PREFIXES_B = tuple(s.encode('ascii') for s in COMMON_PREFIXES)
+    _COMMON_SUFFIXES_B = tuple(s.encode('ascii') for s in COMMON_SUFFIXES)
+
+    # -- per-word generators -------------------------------------------
+
+    @classmethod
+    def append_numbers(cls, word: str) -> Iterator[str]:
+        """Word followed by each common number string."""
+        for number in cls.COMMON_NUMBERS:
+            yield word + number
+
+    @classmethod
+    def prepend_numbers(cls, word: str) -> Iterator[str]:
+        """Word preceded by each common number string."""
+        for number in cls.COMMON_NUMBERS:
+            yield number + word
+
+    @classmethod
+    def append_symbols(cls, word: str) -> Iterator[str]:
+        """Word followed by each common symbol run."""
+        for symbol in cls.COMMON_SYMBOLS:
+            yield word + symbol
+
+    @classmethod
+    def prepend_symbols(cls, word: str) -> Iterator[str]:
+        """Word preceded by each common symbol run."""
+        for symbol in cls.COMMON_SYMBOLS:
+            yield symbol + word
+
+    @classmethod
+    def append_numbers_bytes(cls, word: bytes) -> Iterator[bytes]:
+        """Bytes form of :meth:`append_numbers`; no re-encode at hash time."""
+        for number in cls._COMMON_NUMBERS_B:
+            yield word + number
+
+    @classmethod
+    def prepend_numbers_bytes(cls, word: bytes) -> Iterator[bytes]:
+        """Bytes form of :meth:`prepend_numbers`."""
+        for number in cls._COMMON_NUMBERS_B:
+            yield number + word
+
+    @classmethod
+    def append_symbols_bytes(cls, word: bytes) -> Iterator[bytes]:
+        """Bytes form of :meth:`append_symbols`."""
+        for symbol in cls._COMMON_SYMBOLS_B:
+            yield word + symbol
+
+    @classmethod
+    def prepend_symbols_bytes(cls, word: bytes) -> Iterator[bytes]:
+        """Bytes form of :meth:`prepend_symbols`."""
+        for symbol in cls._COMMON_SYMBOLS_B:
+            yield symbol + word
+
+    @classmethod
+    def leetspeak_variations(cls, word: str) -> Iterator[str]:
+        """Leetspeak variants: full substitution, then one class at a time."""
+        lower = word.lower()
+        # Full substitution in one translate pass over the precompiled
+        # table — no intermediate string per mapped character, and no
+        # risk of one replacement being re-substituted by a later rule.
+        leet_word = lower.translate(cls._LEET_TRANS_PRIMARY)
+        if leet_word != lower:
+            yield leet_word
+        # Partial: a single character class substituted per variant.
+        for char, replacements in cls.LEET_MAP.items():
+            if char not in lower:
+                continue
+            for replacement in replacements:
+                variant = lower.replace(char, replacement)
+                if variant != leet_word:
+                    yield variant
+
+    #: Case transforms applied in order by capitalize_variations: the
+    #: str builtins run as single C calls, plus the two end-capitalized
+    #: shapes users actually type.
+    _CAP_TRANSFORMS = (
+        str.lower,
+        str.capitalize,
+        str.upper,
+        str.swapcase,
+        lambda w: w[:-1] + w[-1].upper(),
+        lambda w: w[0].upper() + w[1:-1] + w[-1].upper(),
+    )
+
+    @classmethod
+    def capitalize_variations(cls, word: str) -> Iterator[str]:
+        """The distinct case shapes of a word.
+
+        Iterates a static transform tuple with a local seen-set, so an
+        already-lowercase word does not emit itself four times over for
+        the hasher to re-check.
+        """
+        if len(word) < 2:
+            if word:
+                lower = word.lower()
+                yield lower
+                if word.upper() != lower:
+                    yield word.upper()
+            return
+        seen = set()
+        for transform in cls._CAP_TRANSFORMS:
+            variant = transform(word)
+            if variant not in seen:
+                seen.add(variant)
+                yield variant
+
+    #: Deletion tables: translate with an empty mapping and a delete
+    #: set runs as one C pass, against a per-character membership test
+    #: in a Python genexp.
+    _DELETE_VOWELS = str.maketrans('', '', 'aeiouAEIOU')
+    _DELETE_CONSONANTS = str.maketrans(
+        '', '', ''.join(c for c in string.ascii_letters
+                        if c.lower() not in 'aeiou'))
+
+    @classmethod
+    def remove_vowels(cls, word: str) -> str:
+        """Word with its vowels dropped (``password`` → ``psswrd``)."""
+        return word.translate(cls._DELETE_VOWELS)
+
+    @classmethod
+    def remove_consonants(cls, word: str) -> str:
+        """Word reduced to its vowels (digits and symbols kept)."""
+        return word.translate(cls._DELETE_CONSONANTS)
+
+    @classmethod
+    def estimate_mutations(cls, num_words: int = 1) -> int:
+        """Upper bound on candidates produced per ``num_words`` base words."""
+        per_word = (2 * len(cls.COMMON_NUMBERS)       # append + prepend
+                    + 2 * len(cls.COMMON_SYMBOLS)
+                    + 4                               # case shapes
+                    + 1                               # full leetspeak
+                    + sum(len(replacements)
+                          for replacements in cls.LEET_MAP.values()))
+        return num_words * per_word
+
+    # -- batch variants ------------------------------------------------
+    #
+    # One flat comprehension per rule: a single C-level concat per
+    # candidate and one right-sized list allocation, instead of a
+    # Python generator frame resumed per candidate.  This is the
+    # interface the rule engine feeds wordlist chunks through.
+
+    @classmethod
+    def append_numbers_batch(cls, words: List[str]) -> List[str]:
+        """Batch form of :meth:`append_numbers` over a wordlist chunk."""
+        numbers = cls.COMMON_NUMBERS
+        return [word + number for word in words for number in numbers]
+
+    @classmethod
+    def prepend_numbers_batch(cls, words: List[str]) -> List[str]:
+        """Batch form of :meth:`prepend_numbers` over a wordlist chunk."""
+        numbers = cls.COMMON_NUMBERS
+        return [number + word for word in words for number in numbers]
+
+    @classmethod
+    def append_symbols_batch(cls, words: List[str]) -> List[str]:
+        """Batch form of :meth:`append_symbols` over a wordlist chunk."""
+        symbols = cls.COMMON_SYMBOLS
+        return [word + symbol for word in words for symbol in symbols]
+
+    @classmethod
+    def prepend_symbols_batch(cls, words: List[str]) -> List[str]:
+        """Batch form of :meth:`prepend_symbols` over a wordlist chunk."""
+        symbols = cls.COMMON_SYMBOLS
+        return [symbol + word for word in words for symbol in symbols]
+
+    @classmethod
+    def mutate_batch(cls, words: List[bytes],
+                     suffixes: Tuple[bytes, ...],
+                     prefixes: Tuple[bytes, ...] = ()) -> List[bytes]:
+        """All affixed variants of a ``bytes`` chunk, word-major.
+
+        Routes through the compiled Cython kernel when built, which
+        assembles each candidate at its final size with two memcpys;
+        otherwise a flat-comprehension fallback.  Callers that hash the
+        output should feed ``bytes`` words to skip re-encoding.
+        """
+        if _crules is not None:
+            return _crules.mutate_batch(words, suffixes, prefixes)
+        return [variant for word in words
+                for variant in ([word + suffix for suffix in suffixes]
+                                + [prefix + word for prefix in prefixes])]
+
+    @classmethod
+    def build_arena(cls, words: List[bytes],
+                    suffixes: Tuple[bytes, ...]
+                    ) -> Tuple[bytearray, array, array]:
+        """Suffixed variants of a chunk as one contiguous byte arena.
+
+        Returns ``(arena, offsets, lengths)``: candidate ``i`` is
+        ``arena[offsets[i]:offsets[i] + lengths[i]]``.  Instead of one
+        heap object per candidate (dozens of bytes of header each,
+        scattered across the allocator), the whole batch lives back to
+        back in a single pre-sized buffer, so a hasher walking it via
+        ``memoryview`` touches memory sequentially and allocates
+        nothing.
+        """
+        total = (sum(len(word) for word in words) * len(suffixes)
+                 + len(words) * sum(len(suffix) for suffix in suffixes))
+        arena = bytearray(total)
+        offsets = array('q')
+        lengths = array('i')
+        position = 0
+        for word in words:
+            word_len = len(word)
+            for suffix in suffixes:
+                end = position + word_len
+                arena[position:end] = word
+                arena[end:end + len(suffix)] = suffix
+                offsets.append(position)
+                lengths.append(word_len + len(suffix))
+                position = end + len(suffix)
+        return arena, offsets, lengths
+
+    @classmethod
+    def leetspeak_batch(cls, words: List[str]) -> List[str]:
+        """Full leetspeak substitution of a whole chunk.
+
+        One ``str.translate`` pass per word through the precompiled
+        table — no per-character Python branching, no intermediate
+        strings from chained ``replace`` calls.
+        """
+        table = cls._LEET_TRANS_PRIMARY
+        return [word.translate(table) for word in words]
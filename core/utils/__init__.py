@@ -0,0 +1,6 @@
+"""Helper utilities."""
+
+from .bloom import BloomFilter
+from .system_info import get_system_info
+
+__all__ = ['BloomFilter', 'get_system_info']
@@ -0,0 +1,56 @@
+"""Fixed-size Bloom filter for streaming dedup.
+
+Used where a ``set`` of every yielded candidate would grow without
+bound (hundreds of bytes per entry for a multi-million-word list).
+A Bloom filter sized for the expected item count trades a tiny
+false-positive rate — a duplicate suppressed that was actually new —
+for constant, cache-friendly memory.
+
+Hashing uses xxhash when installed, otherwise blake2b; either way two
+64-bit halves drive double hashing for the k probe positions.
+"""
+
+import math
+from hashlib import blake2b
+
+try:
+    import xxhash
+    HAVE_XXHASH = True
+except ImportError:
+    xxhash = None
+    HAVE_XXHASH = False
+
+
+class BloomFilter:
+    """Bloom filter over ``bytes`` items."""
+
+    def __init__(self, expected_items: int,
+                 false_positive_rate: float = 1e-4) -> None:
+        expected_items = max(1, expected_items)
+        # Standard sizing: m = -n ln p / (ln 2)^2, k = (m/n) ln 2.
+        m = -expected_items * math.log(false_positive_rate) / (math.log(2) ** 2)
+        self.num_bits = max(64, int(m))
+        self.num_hashes = max(1, round(self.num_bits / expected_items * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _probes(self, item: bytes):
+        if HAVE_XXHASH:
+            h1 = xxhash.xxh64_intdigest(item)
+            h2 = xxhash.xxh64_intdigest(item, seed=1) | 1
+        else:
+            digest = blake2b(item, digest_size=16).digest()
+            h1 = int.from_bytes(digest[:8], 'little')
+            h2 = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    def add(self, item: bytes) -> None:
+        bits = self._bits
+        for probe in self._probes(item):
+            bits[probe >> 3] |= 1 << (probe & 7)
+
+    def __contains__(self, item: bytes) -> bool:
+        bits = self._bits
+        return all(bits[probe >> 3] & (1 << (probe & 7))
+                   for probe in self._probes(item))
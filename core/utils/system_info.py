@@ -0,0 +1,37 @@
+"""Host hardware and runtime probing."""
+
+import os
+import platform
+from typing import Any, Dict
+
+try:
+    import psutil
+    HAVE_PSUTIL = True
+except ImportError:
+    psutil = None
+    HAVE_PSUTIL = False
+
+
+def _total_memory_bytes() -> int:
+    """Physical memory size, via psutil or sysconf."""
+    if HAVE_PSUTIL:
+        return psutil.virtual_memory().total
+    try:
+        return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (ValueError, OSError):
+        return 0
+
+
+def get_system_info() -> Dict[str, Any]:
+    """Snapshot of the host: CPU count, memory, platform, interpreter.
+
+    Drives worker-count and chunk-size decisions in
+    :mod:`..performance.optimizer`.
+    """
+    return {
+        'cpu_count': os.cpu_count() or 1,
+        'total_memory_mb': _total_memory_bytes() // (1024 * 1024),
+        'platform': platform.system(),
+        'machine': platform.machine(),
+        'python_version': platform.python_version(),
+    }
@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""Entry point for the Hash Audit Tool."""
+
+import sys
+
+from cli.interface import main
+
+if __name__ == '__main__':
+    sys.exit(main())